@@ -1,9 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict # Combined imports
+from typing import Optional, List, Dict, FrozenSet # Combined imports
 
 
-@dataclass
+@dataclass(slots=True) # No per-instance __dict__; every attribute is a declared field
 class Article:
     title: str
     link: str
@@ -13,3 +13,14 @@ class Article:
     tickers: Optional[List[str]] = None
     ticker_prices: Optional[Dict[str, float]] = None
     primary_ticker: Optional[str] = None
+    # Frozen copy of tickers for allocation-free membership/intersection checks
+    ticker_set: FrozenSet[str] = field(default=frozenset(), repr=False, compare=False)
+    # Lowercased "title summary" text, computed once for ticker matching
+    search_text: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        title_lower = self.title.lower() if self.title else ""
+        summary_lower = self.summary.lower() if self.summary else ""
+        self.search_text = title_lower + " " + summary_lower
+        if self.tickers:
+            self.ticker_set = frozenset(self.tickers)
@@ -1,10 +1,14 @@
 import argparse
+import atexit
+import functools
+import heapq
 from datetime import datetime, timedelta
-from news_fetcher import fetch_all_news, fetch_major_stocks
+from news_fetcher import fetch_all_news, fetch_article_prices, fetch_major_stocks, set_article_prices
 from article import Article  # For type hinting
-from typing import List, Optional
-import re # For HTML stripping in summary
+from typing import Callable, Dict, List, Optional, Tuple
 import logging # Added logging
+import logging.handlers
+import queue
 
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
@@ -13,6 +17,7 @@ from textual.reactive import reactive
 from textual.binding import Binding
 from textual.screen import ModalScreen
 from textual import events
+from textual.worker import get_current_worker
 
 # For initial messages before TUI starts - will be replaced by logging
 # from colorama import init, Fore, Back, Style
@@ -20,44 +25,97 @@ from textual import events
 
 # Configure logging
 LOG_FILE = "app.log"
+_log_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(module)s.%(funcName)s:%(lineno)d - %(message)s")
+_log_output_handlers = [
+    logging.FileHandler(LOG_FILE, mode='w'), # Overwrite log file each run
+    logging.StreamHandler() # Also print to console for immediate feedback
+]
+for _handler in _log_output_handlers:
+    _handler.setFormatter(_log_formatter)
+# Callers (including the UI thread) only enqueue records; a background listener thread does the file/console I/O
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s")) # Full format is applied by the output handlers
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_output_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop) # Flush queued records on exit
 logging.basicConfig(
     level=logging.INFO, # Default level is INFO for cleaner output
-    format="%(asctime)s - %(levelname)s - %(name)s - %(module)s.%(funcName)s:%(lineno)d - %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE, mode='w'), # Overwrite log file each run
-        logging.StreamHandler() # Also print to console for immediate feedback
-    ]
+    handlers=[_log_queue_handler]
 )
 logger = logging.getLogger(__name__)
 
 
+# Translation table escaping Rich markup brackets in a single pass
+_RICH_ESCAPE = str.maketrans({'[': '\\[', ']': '\\]'})
+
+# Static markup used by the article detail view
+_DETAILS_HEADER = "[bold white on blue] ARTICLE DETAILS [/]"
+_RELATED_HEADER = "[bold white on blue] RELATED ARTICLES [/]"
+_SUMMARY_LABEL = "[bold white]SUMMARY:[/]"
+_NO_SUMMARY = "[italic]No summary available[/]"
+_NO_RELATED = "[italic]No related articles found[/]"
+_DETAILS_FOOTER = "[dim]Press Up/Down arrows to navigate, 'f' to filter, 'r' to reset, 'q' to quit.[/]"
+
+
+def _strip_tags(text: str) -> str:
+    """Replace HTML tags with spaces and collapse whitespace in a single scan.
+    Equivalent to substituting `<[^<]+?>` and then `\\s+`, but splits on '<' instead of running the regex engine.
+    """
+    parts = text.split('<')
+    pieces = [parts[0]]
+    for part in parts[1:]:
+        # The tag body needs at least one character, so search for '>' from index 1
+        end = part.find('>', 1)
+        if end > 0:
+            # A tag: drop everything up to and including the '>'
+            pieces.append(' ')
+            pieces.append(part[end + 1:])
+        else:
+            # A stray '<' (no closing '>' before the next '<'), keep it as text
+            pieces.append('<')
+            pieces.append(part)
+    return ' '.join(''.join(pieces).split())
+
+
 class ArticleDetailPane(Static):
     """A widget to display the details of a selected article."""
     selected_article = reactive(None)
     parent_app = None  # Reference to the parent NewsTUI object for accessing articles
 
+    # Static header of the detail view; only the per-article fields are substituted at runtime
+    _BODY_TMPL = (
+        _DETAILS_HEADER + "\n"
+        "\n"
+        "[bold white]TITLE:[/] {title}\n"
+        "\n"
+        "[bold green]SOURCE:[/] {source}\n"
+        "[bold cyan]DATE:[/] {date}\n"
+        "[bright_blue underline]LINK:[/] {link}\n"
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Formatted markup per article (keyed by id), so re-visiting an article is a dict lookup
+        self._markup_cache: Dict[int, str] = {}
+
+    def clear_cache(self) -> None:
+        """Drop cached markup, e.g. when the article set (and so the related articles) changes."""
+        self._markup_cache.clear()
+
     def _format_article_details(self, article: Optional[Article]) -> str:
         if not article:
             return "[bold yellow]No article selected. Select an article from the list on the left.[/]"
 
-        details = []
-        
-        # Use highly visible formatting for content
-        details.append(f"[bold white on blue] ARTICLE DETAILS [/]")
-        details.append("")
-        
-        details.append(f"[bold white]TITLE:[/] {article.title}")
-        details.append("")
-        
-        details.append(f"[bold green]SOURCE:[/] {article.source}")
-        
-        if article.published_date:
-            details.append(f"[bold cyan]DATE:[/] {article.published_date.strftime('%Y-%m-%d %H:%M:%S')}")
-        else:
-            details.append(f"[bold cyan]DATE:[/] N/A")
-            
-        details.append(f"[bright_blue underline]LINK:[/] {article.link}")
-        details.append("")
+        date_text = article.published_date.strftime('%Y-%m-%d %H:%M:%S') if article.published_date else "N/A"
+
+        # Fixed header section filled from the class-level template in one pass
+        details = [self._BODY_TMPL.format_map({
+            "title": article.title,
+            "source": article.source,
+            "date": date_text,
+            "link": article.link,
+        })]
 
         if article.tickers:
             # Use regular string without rich text formatting for tickers to avoid markup issues
@@ -65,70 +123,62 @@ class ArticleDetailPane(Static):
             details.append(f"[bold yellow]TICKERS:[/] {ticker_text}")
             
             if article.ticker_prices:
-                price_details_list = []
-                for ticker, price in article.ticker_prices.items():
-                    if price is not None:
-                        # Ensure we properly escape any rich text formatting within ticker symbols
-                        safe_ticker = ticker.replace('[', '\\[').replace(']', '\\]')
-                        price_details_list.append(f"{safe_ticker}: [green]${price:.2f}[/]")
-                
-                if price_details_list:
-                    prices_text = ' '.join(price_details_list)
+                # Escape any rich text formatting within ticker symbols while joining
+                prices_text = ' '.join(
+                    f"{ticker.translate(_RICH_ESCAPE)}: [green]${price:.2f}[/]"
+                    for ticker, price in article.ticker_prices.items()
+                    if price is not None
+                )
+                if prices_text:
                     details.append(f"[bold magenta]PRICES:[/] {prices_text}")
             
             details.append("")
 
         # Summary section with basic formatting
-        details.append("[bold white]SUMMARY:[/]")
+        details.append(_SUMMARY_LABEL)
         if article.summary:
-            summary_text = article.summary
             # Simple cleanup of HTML
-            summary_text = re.sub('<[^<]+?>', ' ', summary_text)
-            summary_text = re.sub(r'\s+', ' ', summary_text).strip()
+            summary_text = _strip_tags(article.summary)
             # Escape any potential rich text formatting characters in the content
-            summary_text = summary_text.replace('[', '\\[').replace(']', '\\]')
-            details.append(f"{summary_text}")
+            summary_text = summary_text.translate(_RICH_ESCAPE)
+            details.append(summary_text)
         else:
-            details.append("[italic]No summary available[/]")
+            details.append(_NO_SUMMARY)
         
         # Add related articles section
         if article.tickers and self.parent_app and hasattr(self.parent_app, 'all_articles') and len(self.parent_app.all_articles) > 1:
             details.append("")
-            details.append("[bold white on blue] RELATED ARTICLES [/]")
-            
-            # Find articles with related tickers
-            related_articles = []
-            current_tickers = set(article.tickers)
+            details.append(_RELATED_HEADER)
             
-            for other_article in self.parent_app.all_articles:
-                # Skip the current article
-                if other_article is article:
-                    continue
-                    
-                # Check if this article has any of the same tickers
-                if other_article.tickers and current_tickers.intersection(set(other_article.tickers)):
-                    related_articles.append(other_article)
+            # Look up articles sharing a ticker through the app's ticker index
+            related_articles = self.parent_app.related_articles(article, limit=3)
             
             if related_articles:
                 details.append("")
                 # Show up to 3 related articles
-                for i, related in enumerate(related_articles[:3]):
+                for related in related_articles:
                     date_str = related.published_date.strftime('%m-%d %H:%M') if related.published_date else "No Date"
                     title_str = related.title[:45] + "..." if len(related.title) > 45 else related.title
                     tickers_str = ", ".join(related.tickers) if related.tickers else ""
                     details.append(f"[cyan]{date_str}[/] [bold white]{title_str}[/] [yellow]({tickers_str})[/]")
             else:
-                details.append("[italic]No related articles found[/]")
+                details.append(_NO_RELATED)
         
         details.append("")
-        details.append("[dim]Press Up/Down arrows to navigate, 'f' to filter, 'r' to reset, 'q' to quit.[/]")
-        
+        details.append(_DETAILS_FOOTER)
+
         return "\n".join(details)
 
     def watch_selected_article(self, article: Optional[Article]) -> None:
         """Called when the selected_article reactive attribute changes."""
         try:
-            formatted_content = self._format_article_details(article)
+            if article is None:
+                formatted_content = self._format_article_details(article)
+            else:
+                formatted_content = self._markup_cache.get(id(article))
+                if formatted_content is None:
+                    formatted_content = self._format_article_details(article)
+                    self._markup_cache[id(article)] = formatted_content
             self.update(formatted_content)
         except Exception as e:
             logger.error(f"Error displaying article: {str(e)}", exc_info=True)
@@ -138,6 +188,11 @@ class ArticleDetailPane(Static):
 class NewsTUI(App):
     """A Textual TUI for browsing financial news articles."""
 
+    # Articles are mounted into the list a page at a time, so long lists don't create every widget up front
+    LIST_PAGE_SIZE = 50
+    # Mount the next page when the cursor is within this many items of the end
+    LIST_PAGE_MARGIN = 10
+
     BINDINGS = [
         Binding("q", "quit", "Quit"),
         Binding("up", "cursor_up", "Cursor Up", show=False),
@@ -234,20 +289,88 @@ class NewsTUI(App):
     }
     """
 
-    def __init__(self, articles: List[Article], cli_args: argparse.Namespace):
+    def __init__(self, articles: List[Article], cli_args: argparse.Namespace, article_loader: Optional[Callable[[], List[Article]]] = None,
+                 price_loader: Optional[Callable[[List[Article]], Dict[str, float]]] = None):
         super().__init__()
         self.articles: List[Article] = articles
-        # Make sure we create a proper copy of the articles for filtering
-        self.all_articles: List[Article] = articles.copy()  # Store original list for filtering
+        # Optional callable that fetches articles in a worker thread after the UI has mounted
+        self.article_loader = article_loader
+        # Optional callable that fetches ticker -> price for loaded articles, run in the same worker once they are shown
+        self.price_loader = price_loader
+        # Immutable snapshot of the original articles; filtering never mutates it, so it is shared rather than copied
+        self.all_articles: Tuple[Article, ...] = tuple(articles)
         self.cli_args: argparse.Namespace = cli_args
         self.article_list_pane: Optional[ListView] = None
         self.article_detail_pane: Optional[ArticleDetailPane] = None
         self.current_filter: Optional[str] = None
         self.loaded_successfully = False
+        self._rendered_count = 0  # How many of self.articles are currently mounted in the list view
+        self._stock_map: Optional[Dict[str, str]] = None  # Loaded on first use, then reused
+        self._by_ticker: Dict[str, List[int]] = {}  # ticker -> ascending positions in all_articles
+        self._article_positions: Dict[int, int] = {}
+        self._sorted_tickers: List[str] = []  # Filter menu entries, kept in sync with _by_ticker
+        self._list_labels: Dict[int, str] = {}  # List-item markup per article (keyed by id)
+        self._short_titles: Dict[int, str] = {}  # Truncated list-view titles, computed once per article
+        self._build_ticker_index()
         
         # Debug initialization
-        logger.debug(f"NewsTUI initialized with {len(articles)} articles")
-        logger.debug(f"self.articles has {len(self.articles)} items and self.all_articles has {len(self.all_articles)} items")
+        logger.debug("NewsTUI initialized with %d articles", len(articles))
+        logger.debug("self.articles has %d items and self.all_articles has %d items", len(self.articles), len(self.all_articles))
+
+    def _build_ticker_index(self) -> None:
+        """Index all_articles by ticker so filtering and related-article lookups avoid full rescans."""
+        self._by_ticker = {}
+        self._article_positions = {}
+        for position, article in enumerate(self.all_articles):
+            self._article_positions[id(article)] = position
+            for ticker in article.ticker_set:
+                self._by_ticker.setdefault(ticker, []).append(position)
+        self._sorted_tickers = sorted(self._by_ticker)
+        logger.debug("Built ticker index with %d tickers", len(self._by_ticker))
+
+    def related_articles(self, article: Article, limit: int = 3) -> List[Article]:
+        """Return up to `limit` other articles sharing a ticker with `article`, in list order."""
+        own_position = self._article_positions.get(id(article))
+        related: List[Article] = []
+        last_position = None
+        # Position lists are ascending, so a lazy k-way merge yields matches in list order
+        # and stops as soon as `limit` distinct articles are found
+        for position in heapq.merge(*(self._by_ticker.get(ticker, ()) for ticker in article.ticker_set)):
+            if position == own_position or position == last_position:
+                continue
+            last_position = position
+            related.append(self.all_articles[position])
+            if len(related) >= limit:
+                break
+        return related
+
+    def short_title(self, article: Article, max_title_len: int = 45) -> str:
+        """Return the article title truncated for list display, computing it once per article."""
+        title = self._short_titles.get(id(article))
+        if title is None:
+            title = article.title
+            if len(title) > max_title_len:
+                title = title[:max_title_len - 3] + "..."
+            self._short_titles[id(article)] = title
+        return title
+
+    def _list_label(self, article: Article) -> str:
+        """Return the list-item markup for an article, formatting it only on first use."""
+        label = self._list_labels.get(id(article))
+        if label is None:
+            date_str = article.published_date.strftime('%m-%d %H:%M') if article.published_date else "No Date"
+            display_title = self.short_title(article)
+
+            # Fix: Properly handle ticker formatting without causing Rich markup issues
+            ticker_info = ""
+            if article.tickers:
+                # Escape any brackets in tickers to avoid Rich markup errors
+                safe_tickers = [t.translate(_RICH_ESCAPE) for t in article.tickers]
+                ticker_info = f"[yellow]({', '.join(safe_tickers)})[/]"
+
+            label = f"[cyan]{date_str}[/] [bold white]{display_title}[/] {ticker_info}"
+            self._list_labels[id(article)] = label
+        return label
 
     def compose(self) -> ComposeResult:
         """Compose the TUI layout."""
@@ -264,7 +387,7 @@ class NewsTUI(App):
 
     async def on_mount(self) -> None:
         """Called when the app is mounted."""
-        logger.debug(f"NewsTUI.on_mount() starting. Initial self.article_list_pane type: {type(self.article_list_pane)}, Initial self.article_detail_pane type: {type(self.article_detail_pane)}")
+        logger.debug("NewsTUI.on_mount() starting. Initial self.article_list_pane type: %s, Initial self.article_detail_pane type: %s", type(self.article_list_pane), type(self.article_detail_pane))
         current_article_list_pane = None # Local var for clarity
         current_article_detail_pane = None
 
@@ -280,7 +403,7 @@ class NewsTUI(App):
                 if self.article_detail_pane:
                     self.article_detail_pane.parent_app = self
                 
-                logger.debug(f"NewsTUI.on_mount() after query_one: current_article_list_pane is {type(current_article_list_pane)}, current_article_detail_pane is {type(current_article_detail_pane)}")
+                logger.debug("NewsTUI.on_mount() after query_one: current_article_list_pane is %s, current_article_detail_pane is %s", type(current_article_list_pane), type(current_article_detail_pane))
             except Exception as e_query: 
                 logger.critical(f"CRITICAL: Could not query #article_list_view or #article_detail_content in on_mount: {e_query}", exc_info=True)
                 self.notify("Critical TUI error: UI panes not found. Check log.", severity="error")
@@ -289,25 +412,96 @@ class NewsTUI(App):
                      placeholder_detail_pane.update("[bold red]CRITICAL ERROR: UI Panes failed to load. Check app.log.[/]")
                 return
             
-            if not self.articles:
-                self.notify("No articles found matching your search criteria", severity="warning")
-                logger.warning("No articles found matching search criteria on mount.")
-                if current_article_detail_pane:
-                    current_article_detail_pane.update("[bold yellow]No articles found![/]\\n\\nTry adjusting your search criteria or time interval.")
+            if self.article_loader is not None:
+                # Fetch in the background so the UI is responsive while feeds download
+                current_article_detail_pane.update("[bold cyan]Loading articles...[/]")
+                self.run_worker(self._load_articles_in_background, name="article_loader", thread=True, exclusive=True)
                 return
-                
-            logger.debug(f"NewsTUI.on_mount() calling refresh_article_list. current_article_list_pane is: {current_article_list_pane}, current_article_detail_pane is: {current_article_detail_pane}")
-            # Pass the queried panes directly
-            self.loaded_successfully = self.refresh_article_list(current_article_list_pane, current_article_detail_pane)
-            if not self.loaded_successfully:
-                logger.error("Problem displaying articles during on_mount. loaded_successfully is False.")
-                self.notify("Problem displaying articles. Check log for details.", severity="error")
+
+            self._show_articles(current_article_list_pane, current_article_detail_pane)
         except Exception as e:
             logger.error(f"Error initializing TUI on_mount: {str(e)}", exc_info=True)
             self.notify(f"Error initializing: {str(e)}. Check log.", severity="error")
             if current_article_detail_pane:
                 current_article_detail_pane.update(f"[bold red]Error loading article list:[/]\\n\\n{str(e)}\\n\\nCheck the log for more details.")
 
+    def _show_articles(self, list_pane: Optional[ListView], detail_pane: Optional[ArticleDetailPane]) -> None:
+        """Populate the panes with self.articles, or show a notice if there are none."""
+        if not self.articles:
+            self.notify("No articles found matching your search criteria", severity="warning")
+            logger.warning("No articles found matching search criteria on mount.")
+            if detail_pane:
+                detail_pane.update("[bold yellow]No articles found![/]\\n\\nTry adjusting your search criteria or time interval.")
+            return
+            
+        logger.debug("NewsTUI._show_articles() calling refresh_article_list. list_pane is: %s, detail_pane is: %s", list_pane, detail_pane)
+        # Pass the queried panes directly
+        self.loaded_successfully = self.refresh_article_list(list_pane, detail_pane)
+        if not self.loaded_successfully:
+            logger.error("Problem displaying articles. loaded_successfully is False.")
+            self.notify("Problem displaying articles. Check log for details.", severity="error")
+
+    def _load_articles_in_background(self) -> None:
+        """Worker body: run the article loader off the UI thread and hand the result back to it.
+        Quitting cancels the worker: it then skips the price lookups and leaves the UI alone. A feed fetch
+        that is already running cannot be interrupted, so exit still waits for it to finish.
+        """
+        worker = get_current_worker()
+        try:
+            articles = self.article_loader()
+            logger.info(f"Background loading finished with {len(articles)} articles.")
+            if worker.is_cancelled:
+                return
+            self.call_from_thread(self.set_articles, articles)
+        except Exception as e:
+            logger.error(f"Error loading articles in background: {e}", exc_info=True)
+            if not worker.is_cancelled:
+                try:
+                    self.call_from_thread(self._show_load_error, e)
+                except Exception as report_error:
+                    logger.error(f"Could not report the article loading error: {report_error}", exc_info=True)
+            return
+        if self.price_loader is None or not articles or worker.is_cancelled:
+            return
+        # Quote lookups run after the list is shown, so they don't delay it
+        try:
+            prices = self.price_loader(articles)
+            if worker.is_cancelled:
+                return
+            self.call_from_thread(self.refresh_prices, articles, prices)
+        except Exception as e:
+            logger.error(f"Error loading prices in background: {e}", exc_info=True)
+
+    def _show_load_error(self, error: Exception) -> None:
+        """Replace the loading notice with the error from a failed background load."""
+        self.notify(f"Error loading articles: {str(error)}. Check log.", severity="error")
+        if self.article_detail_pane:
+            self.article_detail_pane.update(
+                f"[bold red]Error loading articles:[/]\n\n{str(error).translate(_RICH_ESCAPE)}\n\nCheck the log for more details."
+            )
+
+    def refresh_prices(self, articles: List[Article], prices: Dict[str, float]) -> None:
+        """Set fetched prices on the articles and redraw the article details.
+        Runs on the UI thread, so articles are never changed while they are being rendered.
+        """
+        set_article_prices(articles, prices)
+        if self.article_detail_pane:
+            # Cached markup was formatted without the prices
+            self.article_detail_pane.clear_cache()
+            self.article_detail_pane.watch_selected_article(self.article_detail_pane.selected_article)
+
+    def set_articles(self, articles: List[Article]) -> None:
+        """Replace the displayed articles (e.g. when background loading completes) and refresh the panes."""
+        self.articles = articles
+        self.all_articles = tuple(articles)
+        self.current_filter = None
+        self._list_labels.clear()
+        self._short_titles.clear()
+        self._build_ticker_index()
+        if self.article_detail_pane:
+            self.article_detail_pane.clear_cache()
+        self._show_articles(self.article_list_pane, self.article_detail_pane)
+
     async def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Called when an item in the ListView is selected."""
         try:
@@ -315,6 +509,9 @@ class NewsTUI(App):
             # First check if we can access article_data
             if hasattr(selected_list_item, 'article_data'): 
                 article = selected_list_item.article_data
+                if article is not None and article is self.article_detail_pane.selected_article:
+                    # Re-selecting the shown article; skip the detail re-render
+                    return
                 if article:
                     self.article_detail_pane.selected_article = article
                 else:
@@ -339,21 +536,16 @@ class NewsTUI(App):
 
     def action_show_filter_menu(self) -> None:
         """Show the filter menu to filter articles by ticker."""
-        # Collect all unique tickers from articles
-        all_tickers = set()
-        for article in self.all_articles:
-            if article.tickers:
-                all_tickers.update(article.tickers)
-        
-        if not all_tickers:
+        # The ticker index already holds every unique ticker, sorted once when it was built
+        if not self._sorted_tickers:
             self.notify("No tickers found in articles", severity="warning")
             return
         
         # Create a menu of tickers to filter by
-        menu_items = sorted(list(all_tickers))
+        menu_items = self._sorted_tickers
         
         # Get company names for tickers
-        stock_map = fetch_major_stocks()
+        stock_map = self.get_stock_map()
         
         # Use a modal instead of the notification approach
         class TickerFilterDialog(ModalScreen):
@@ -370,6 +562,7 @@ class NewsTUI(App):
                 self.parent_tui = parent_tui
                 self.selected_index = 0
                 self.stock_map = stock_map
+                self._ticker_buttons: List[Button] = []
                 
             def compose(self) -> ComposeResult:
                 with Vertical(id="ticker_dialog"):
@@ -400,52 +593,34 @@ class NewsTUI(App):
                     self.parent_tui.filter_by_ticker(ticker)
             
             def on_mount(self) -> None:
+                # Cache the ticker buttons once so cursor moves don't re-query the DOM
+                self._ticker_buttons = list(self.query(".ticker-button"))
                 # Focus the first ticker button
                 self.query_one("#ticker-" + self.tickers[0], Button).focus()
             
-            def action_cursor_up(self) -> None:
-                # Move selection up
-                buttons = self.query(".ticker-button")
+            def _move_selection(self, step: int) -> None:
+                # selected_index is the source of truth, so moving is O(1) rather than a scan for the "selected" class
+                buttons = self._ticker_buttons
                 if not buttons:
                     return
                 
-                for i, button in enumerate(buttons):
-                    if button.has_class("selected"):
-                        button.remove_class("selected")
-                        new_index = (i - 1) % len(buttons)
-                        buttons[new_index].add_class("selected")
-                        buttons[new_index].focus()
-                        self.selected_index = new_index
-                        break
-                else:
-                    # If no selection, select the last one
-                    buttons[-1].add_class("selected")
-                    buttons[-1].focus()
-                    self.selected_index = len(buttons) - 1
+                buttons[self.selected_index].remove_class("selected")
+                new_index = (self.selected_index + step) % len(buttons)
+                buttons[new_index].add_class("selected")
+                buttons[new_index].focus()
+                self.selected_index = new_index
+            
+            def action_cursor_up(self) -> None:
+                # Move selection up
+                self._move_selection(-1)
             
             def action_cursor_down(self) -> None:
                 # Move selection down
-                buttons = self.query(".ticker-button")
-                if not buttons:
-                    return
-                
-                for i, button in enumerate(buttons):
-                    if button.has_class("selected"):
-                        button.remove_class("selected")
-                        new_index = (i + 1) % len(buttons)
-                        buttons[new_index].add_class("selected")
-                        buttons[new_index].focus()
-                        self.selected_index = new_index
-                        break
-                else:
-                    # If no selection, select the first one
-                    buttons[0].add_class("selected")
-                    buttons[0].focus()
-                    self.selected_index = 0
+                self._move_selection(1)
             
             def action_select_ticker(self) -> None:
                 # Select the currently focused ticker
-                buttons = self.query(".ticker-button")
+                buttons = self._ticker_buttons
                 if buttons and 0 <= self.selected_index < len(buttons):
                     button = buttons[self.selected_index]
                     button_id = button.id
@@ -458,28 +633,41 @@ class NewsTUI(App):
         # Show the ticker dialog
         self.push_screen(TickerFilterDialog(menu_items, self, stock_map))
 
+    def get_stock_map(self) -> Dict[str, str]:
+        """Return the ticker to company name map, loading it only once per app session."""
+        if self._stock_map is None:
+            self._stock_map = fetch_major_stocks()
+        return self._stock_map
+
     def filter_by_ticker(self, ticker: str) -> None:
         """Filter articles to show only those containing the specified ticker."""
+        if self.current_filter == ticker:
+            # Same filter re-applied; the list is already showing these articles
+            self.notify(f"Already filtered by {ticker}", severity="information")
+            logger.info(f"Filter for {ticker} already active, skipping refresh.")
+            return
         self.current_filter = ticker
         logger.info(f"Filtering by ticker: {ticker}")
         
         # Debug the state before filtering
-        logger.debug(f"Before filtering: all_articles={len(self.all_articles)}, current articles={len(self.articles)}")
-        logger.debug(f"Filtering for ticker: {ticker}")
+        logger.debug("Before filtering: all_articles=%d, current articles=%d", len(self.all_articles), len(self.articles))
+        logger.debug("Filtering for ticker: %s", ticker)
         
         # Log the state of all articles and their tickers
-        logger.debug("=== ARTICLES BEFORE FILTERING ===")
-        for i, article in enumerate(self.all_articles[:5]):
-            logger.debug(f"Article {i+1}: {article.title} - Tickers: {article.tickers}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("=== ARTICLES BEFORE FILTERING ===")
+            for i, article in enumerate(self.all_articles[:5]):
+                logger.debug("Article %d: %s - Tickers: %s", i + 1, article.title, article.tickers)
         
         # Use strict filtering - only show articles where the ticker is explicitly listed
-        filtered_articles = [a for a in self.all_articles if a.tickers and ticker in a.tickers]
+        filtered_articles = [self.all_articles[position] for position in self._by_ticker.get(ticker, ())]
         
-        logger.debug(f"After filtering: found {len(filtered_articles)} articles with ticker {ticker}")
+        logger.debug("After filtering: found %d articles with ticker %s", len(filtered_articles), ticker)
         # Debug the filtered articles to verify tickers
-        logger.debug("=== ARTICLES AFTER FILTERING ===")
-        for i, article in enumerate(filtered_articles[:5]):
-            logger.debug(f"Filtered article {i+1}: Title='{article.title}', Tickers={article.tickers}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("=== ARTICLES AFTER FILTERING ===")
+            for i, article in enumerate(filtered_articles[:5]):
+                logger.debug("Filtered article %d: Title='%s', Tickers=%s", i + 1, article.title, article.tickers)
         
         if not filtered_articles:
             self.notify(f"No articles found for ticker {ticker}", severity="warning")
@@ -489,9 +677,9 @@ class NewsTUI(App):
         # Update articles list and refresh the view
         logger.debug("Setting self.articles to filtered articles")
         self.articles = filtered_articles
-        logger.debug(f"Length of self.articles after update: {len(self.articles)}")
+        logger.debug("Length of self.articles after update: %d", len(self.articles))
         success = self.refresh_article_list()
-        logger.debug(f"refresh_article_list returned: {success}")
+        logger.debug("refresh_article_list returned: %s", success)
         
         self.notify(f"Filtered to show {len(filtered_articles)} articles for {ticker}", severity="success")
         logger.info(f"Filtered to {len(filtered_articles)} articles for {ticker}.")
@@ -499,7 +687,7 @@ class NewsTUI(App):
     def action_reset_filter(self) -> None:
         """Reset any active filters and show all articles."""
         if self.current_filter:
-            self.articles = self.all_articles.copy()
+            self.articles = list(self.all_articles)
             self.current_filter = None
             self.refresh_article_list()
             self.notify("Filter reset, showing all articles", severity="success")
@@ -508,6 +696,38 @@ class NewsTUI(App):
             self.notify("No active filter", severity="information")
             logger.info("Reset filter called but no active filter.")
 
+    def _mount_next_page(self, list_pane: ListView) -> int:
+        """Mount the next LIST_PAGE_SIZE articles into the list view in one batch.
+        Returns the number of items added.
+        """
+        start = self._rendered_count
+        end = min(start + self.LIST_PAGE_SIZE, len(self.articles))
+        # Build all items first, then mount them in one batch instead of one mount per item
+        list_items: List[ListItem] = []
+        for i in range(start, end):
+            article_item = self.articles[i]
+            try:
+                list_item_label = self._list_label(article_item)
+                list_item = ListItem(Label(list_item_label), name=str(i), classes="article-list-item")
+                list_item.article_data = article_item  # type: ignore
+                list_items.append(list_item)
+            except Exception as e:
+                self.notify(f"Error with article {i}: {str(e)}", severity="warning")
+                logger.error(f"Error processing article {i} for list view: {e}", exc_info=True)
+
+        list_pane.extend(list_items)
+        self._rendered_count = end
+        return len(list_items)
+
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        """Mount more articles once the cursor gets close to the last mounted item."""
+        list_pane = self.article_list_pane
+        if list_pane is None or list_pane.index is None or self._rendered_count >= len(self.articles):
+            return
+        if list_pane.index >= len(list_pane.children) - self.LIST_PAGE_MARGIN:
+            added_count = self._mount_next_page(list_pane)
+            logger.debug("Mounted %d more articles (%d of %d rendered)", added_count, self._rendered_count, len(self.articles))
+
     def refresh_article_list(self, list_pane_override: Optional[ListView] = None, detail_pane_override: Optional[ArticleDetailPane] = None) -> bool:
         """Refresh the article list view with current articles.
         Accepts optional overrides for list_pane and detail_pane for robust calling.
@@ -517,9 +737,9 @@ class NewsTUI(App):
         active_list_pane = list_pane_override if list_pane_override else self.article_list_pane
         active_detail_pane = detail_pane_override if detail_pane_override else self.article_detail_pane
         
-        logger.debug(f"refresh_article_list called. active_list_pane: {type(active_list_pane)}, active_detail_pane: {type(active_detail_pane)}")
-        logger.debug(f"Current self.articles length: {len(self.articles)}")
-        logger.debug(f"Current filter: {self.current_filter}")
+        logger.debug("refresh_article_list called. active_list_pane: %s, active_detail_pane: %s", type(active_list_pane), type(active_detail_pane))
+        logger.debug("Current self.articles length: %d", len(self.articles))
+        logger.debug("Current filter: %s", self.current_filter)
 
         try:
             if active_list_pane is None: # Explicit check for None
@@ -527,11 +747,11 @@ class NewsTUI(App):
                 return False
             
             # Log the state of the pane before clearing
-            logger.debug(f"active_list_pane before clear: {active_list_pane!r}, has children: {bool(active_list_pane.children)}")
+            logger.debug("active_list_pane before clear: %r, has children: %s", active_list_pane, bool(active_list_pane.children))
 
             active_list_pane.clear()
             
-            logger.debug(f"Refreshing article list with {len(self.articles)} articles using {id(active_list_pane)}")
+            logger.debug("Refreshing article list with %d articles using %d", len(self.articles), id(active_list_pane))
             
             if not self.articles:
                 logger.debug("No articles to display, adding placeholder item")
@@ -544,35 +764,13 @@ class NewsTUI(App):
                 logger.info("refresh_article_list: No articles to display.")
                 return False
 
-            added_count = 0
-            for i, article_item in enumerate(self.articles):
-                try:
-                    max_title_len = 45
-                    date_str = article_item.published_date.strftime('%m-%d %H:%M') if article_item.published_date else "No Date"
-                    display_title = article_item.title
-                    if len(display_title) > max_title_len:
-                        display_title = display_title[:max_title_len - 3] + "..."
-                    
-                    # Fix: Properly handle ticker formatting without causing Rich markup issues
-                    ticker_info = ""
-                    if article_item.tickers:
-                        # Escape any brackets in tickers to avoid Rich markup errors
-                        safe_tickers = [t.replace('[', '\\[').replace(']', '\\]') for t in article_item.tickers]
-                        ticker_info = f"[yellow]({', '.join(safe_tickers)})[/]"
-                    
-                    list_item_label = f"[cyan]{date_str}[/] [bold white]{display_title}[/] {ticker_info}"
-                    list_item = ListItem(Label(list_item_label), name=str(i), classes="article-list-item")
-                    list_item.article_data = article_item  # type: ignore
-                    active_list_pane.append(list_item)
-                    added_count += 1
-                except Exception as e:
-                    self.notify(f"Error with article {i}: {str(e)}", severity="warning")
-                    logger.error(f"Error processing article {i} for list view: {e}", exc_info=True)
-            
-            logger.debug(f"Added {added_count} articles to the list view using {id(active_list_pane)}")
+            # Only mount the first page; further pages are mounted as the cursor approaches them
+            self._rendered_count = 0
+            added_count = self._mount_next_page(active_list_pane)
+            logger.debug("Added %d articles to the list view using %d", added_count, id(active_list_pane))
             
             if self.articles and active_list_pane.children:
-                logger.debug(f"Setting selection to first article (total: {len(active_list_pane.children)}) using {id(active_list_pane)}")
+                logger.debug("Setting selection to first article (total: %d) using %d", len(active_list_pane.children), id(active_list_pane))
                 active_list_pane.index = 0
                 
                 first_article_item = active_list_pane.children[0]
@@ -594,10 +792,116 @@ class NewsTUI(App):
             return False
 
 
-def main():
-    """Main function to parse arguments and fetch/display news."""
-    # Note: Logging is configured at the top of the file
+# --time-interval choices (besides "today") and how far back each one reaches
+_INTERVAL_DELTAS = {
+    "last-hour": timedelta(hours=1),
+    "last-4-hours": timedelta(hours=4),
+    "last-12-hours": timedelta(hours=12),
+    "last-24-hours": timedelta(hours=24),
+    "last-15-minutes": timedelta(minutes=15),
+    "last-30-minutes": timedelta(minutes=30),
+}
+
+
+def _resolve_time_filter(time_interval: Optional[str], now: datetime) -> Optional[datetime]:
+    """Earliest publication time allowed by a --time-interval choice, or None when no interval applies."""
+    if time_interval == "today":
+        return datetime(now.year, now.month, now.day, 0, 0, 0)
+    if time_interval in _INTERVAL_DELTAS:
+        return now - _INTERVAL_DELTAS[time_interval]
+    return None
+
+
+def _published_key(article: Article) -> datetime:
+    """Publication date used to order articles by recency; undated articles count as the oldest."""
+    return article.published_date if article.published_date else datetime.min
+
+
+def collect_articles(args: argparse.Namespace, stock_symbols_list: Optional[List[str]], debug_flag: bool, use_mock: bool,
+                     fetch_prices: bool = True) -> List[Article]:
+    """Fetch, filter, sort and limit articles for the TUI according to the CLI arguments.
+    Runs in a background worker thread so the TUI can start before the feeds are downloaded.
+    With fetch_prices=False no prices are looked up; the caller attaches them to the returned articles.
+    """
+    if debug_flag: # This also sets logging level if needed, but basicConfig already set to DEBUG
+        logger.info("DEBUG MODE: Starting article fetch...")
+        
+    time_filter = _resolve_time_filter(args.time_interval, datetime.now())
+    
+    # Pass the time window down so articles outside it are never scanned for tickers;
+    # fetch_all_news applies it to both real and mock articles, so no second pass is needed here
+    if time_filter:
+        logger.info(f"Filtering articles published since: {time_filter}")
+    articles = fetch_all_news(stock_symbols=stock_symbols_list, source_limit=args.source_limit, use_mock=use_mock,
+                              published_since=time_filter, fetch_prices=fetch_prices)
+    
+    if debug_flag:
+        logger.debug(f"Fetched {len(articles)} total articles before primary filtering/sorting")
+    
+    # Additional strict filtering if specific stocks were requested
+    if stock_symbols_list and articles:
+        logger.info(f"Applying strict filtering for requested stocks: {stock_symbols_list}")
+        original_count = len(articles)
+        
+        # Only keep articles where one of the requested stocks is the primary ticker
+        # or the requested ticker is prominently featured in the article
+        strictly_filtered_articles = []
+        requested_symbols = frozenset(stock_symbols_list)
+        # Lowercase the requested symbols once rather than per article.
+        # A "$sym" mention always contains "sym" itself, so the plain substring check covers it.
+        lowered_symbols = {ticker: ticker.lower() for ticker in requested_symbols}
+        for article in articles:
+            should_include = False
+            
+            # Check if article has a primary ticker that matches one of the requested symbols
+            if article.primary_ticker:
+                if article.primary_ticker in requested_symbols:
+                    should_include = True
+                    logger.debug("Including article '%.40s...' - primary ticker %s matches request", article.title, article.primary_ticker)
+            
+            # If no primary ticker match, check if article title contains the ticker or company name
+            if not should_include and article.ticker_set:
+                title_lower = article.title.lower() if article.title else ""
+                # Only requested tickers the article is tagged with need the title check
+                for ticker in requested_symbols & article.ticker_set:
+                    # Check if ticker appears in title (case insensitive)
+                    if lowered_symbols[ticker] in title_lower:
+                        should_include = True
+                        logger.debug("Including article '%.40s...' - ticker %s in title", article.title, ticker)
+                        break
+            
+            if should_include:
+                strictly_filtered_articles.append(article)
+        
+        articles = strictly_filtered_articles
+        logger.info(f"Strict filtering reduced articles from {original_count} to {len(articles)}")
+    
+    # Only the newest `limit` articles reach the TUI, so select them with a bounded heap instead of sorting everything
+    articles_to_pass_to_tui = heapq.nlargest(args.limit, articles, key=_published_key)
+    logger.info(f"Limiting articles to {args.limit}, passing {len(articles_to_pass_to_tui)} to TUI.")
     
+    if not articles_to_pass_to_tui and (args.stocks or args.time_interval):
+         logger.warning("No news articles found matching specific criteria after filtering and limiting.")
+    elif not articles_to_pass_to_tui:
+         logger.warning("No news articles found from any source after filtering and limiting.")
+    else:
+         logger.info(f"Passing {len(articles_to_pass_to_tui)} articles to the TUI.")
+         if debug_flag:
+             all_tickers_in_tui_set = set()
+             for article in articles_to_pass_to_tui:
+                 if article.tickers:
+                     all_tickers_in_tui_set.update(article.tickers)
+             ticker_summary = ', '.join(all_tickers_in_tui_set) if all_tickers_in_tui_set else "None found"
+             logger.debug(f"Articles for TUI contain these tickers: {ticker_summary}")
+             logger.debug(f"Article data before passing to TUI (first 3):")
+             for i, article in enumerate(articles_to_pass_to_tui[:3]):
+                 logger.debug(f"  Article {i+1}: Title='{article.title}', Date='{article.published_date}', Source='{article.source}', Tickers='{article.tickers}', Summary Length='{len(article.summary) if article.summary else 0}'")
+
+    return articles_to_pass_to_tui
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Command line options of the app."""
     parser = argparse.ArgumentParser(
         description="Finance Stock News Collector. Fetches news from RSS feeds and filters by stock symbols."
     )
@@ -625,7 +929,7 @@ def main():
     parser.add_argument(
         "--time-interval",
         type=str,
-        choices=["today", "last-hour", "last-4-hours", "last-12-hours", "last-24-hours", "last-15-minutes", "last-30-minutes"],
+        choices=["today", *_INTERVAL_DELTAS],
         help="Filter articles by publication time (e.g., today, last-hour, last-4-hours, last-15-minutes)."
     )
     parser.add_argument(
@@ -638,13 +942,13 @@ def main():
         action="store_true",
         help="Use mock articles instead of fetching from real sources (for testing)."
     )
+    return parser
 
-    args = parser.parse_args()
 
-    logger.info(f"Application started with args: {args}")
-    # Print welcome message (can be removed if Header is sufficient)
-    # print(f"\n{Back.WHITE}{Fore.BLACK}{Style.BRIGHT} Finance Stock News Collector {Style.RESET_ALL}")
-    
+def resolve_stock_symbols(args: argparse.Namespace) -> Optional[List[str]]:
+    """Ticker symbols to fetch news for, from --stocks or by matching --company against company names.
+    None means general news.
+    """
     stock_symbols_list: Optional[List[str]] = None
     if args.stocks:
         stock_symbols_list = [symbol.strip().upper() for symbol in args.stocks.split(',') if symbol.strip()]
@@ -677,10 +981,22 @@ def main():
             logger.info("Falling back to direct company name search")
             # Try a simple approach - use the company name as a search term for articles
             stock_symbols_list = None
-            # Set debug flag to make detailed matching info visible in logs
-            debug_flag = True
     else:
         logger.info("Fetching general finance news (no stock symbols specified)...")
+    return stock_symbols_list
+
+
+def main():
+    """Main function to parse arguments and fetch/display news."""
+    # Note: Logging is configured at the top of the file
+    
+    args = build_arg_parser().parse_args()
+
+    logger.info(f"Application started with args: {args}")
+    # Print welcome message (can be removed if Header is sufficient)
+    # print(f"\n{Back.WHITE}{Fore.BLACK}{Style.BRIGHT} Finance Stock News Collector {Style.RESET_ALL}")
+    
+    stock_symbols_list = resolve_stock_symbols(args)
 
     debug_flag = args.debug if hasattr(args, 'debug') else False
     use_mock = args.mock if hasattr(args, 'mock') else False
@@ -693,106 +1009,12 @@ def main():
     if use_mock:
         logger.info("Using mock articles instead of fetching from real sources.")
     
-    if debug_flag: # This also sets logging level if needed, but basicConfig already set to DEBUG
-        logger.info("DEBUG MODE: Starting article fetch...")
-        
-    articles = fetch_all_news(stock_symbols=stock_symbols_list, source_limit=args.source_limit, use_mock=use_mock)
-    
-    if debug_flag:
-        logger.debug(f"Fetched {len(articles)} total articles before primary filtering/sorting")
-    
-    articles.sort(key=lambda x: x.published_date if x.published_date else datetime.min, reverse=True)
-    
-    # Additional strict filtering if specific stocks were requested
-    if stock_symbols_list and articles:
-        logger.info(f"Applying strict filtering for requested stocks: {stock_symbols_list}")
-        original_count = len(articles)
-        
-        # Only keep articles where one of the requested stocks is the primary ticker
-        # or the requested ticker is prominently featured in the article
-        strictly_filtered_articles = []
-        for article in articles:
-            should_include = False
-            
-            # Check if article has a primary ticker that matches one of the requested symbols
-            if hasattr(article, 'primary_ticker') and article.primary_ticker:
-                if article.primary_ticker in stock_symbols_list:
-                    should_include = True
-                    logger.debug(f"Including article '{article.title[:40]}...' - primary ticker {article.primary_ticker} matches request")
-            
-            # If no primary ticker match, check if article title contains the ticker or company name
-            if not should_include and article.tickers:
-                for ticker in stock_symbols_list:
-                    if ticker in article.tickers:
-                        # Check if ticker appears in title (case insensitive)
-                        title_lower = article.title.lower() if article.title else ""
-                        if ticker.lower() in title_lower or f"${ticker.lower()}" in title_lower:
-                            should_include = True
-                            logger.debug(f"Including article '{article.title[:40]}...' - ticker {ticker} in title")
-                            break
-            
-            if should_include:
-                strictly_filtered_articles.append(article)
-        
-        articles = strictly_filtered_articles
-        logger.info(f"Strict filtering reduced articles from {original_count} to {len(articles)}")
-    
-    if args.time_interval and articles:
-        now = datetime.now()
-        time_filter = None
-        
-        if args.time_interval == "today":
-            time_filter = datetime(now.year, now.month, now.day, 0, 0, 0)
-        elif args.time_interval == "last-hour":
-            time_filter = now - timedelta(hours=1)
-        elif args.time_interval == "last-4-hours":
-            time_filter = now - timedelta(hours=4)
-        elif args.time_interval == "last-12-hours":
-            time_filter = now - timedelta(hours=12)
-        elif args.time_interval == "last-24-hours":
-            time_filter = now - timedelta(hours=24)
-        elif args.time_interval == "last-15-minutes":
-            time_filter = now - timedelta(minutes=15)
-        elif args.time_interval == "last-30-minutes":
-            time_filter = now - timedelta(minutes=30)
-            
-        if time_filter:
-            logger.info(f"Filtering articles published since: {time_filter}")
-            original_count = len(articles)
-            articles = [article for article in articles if article.published_date and article.published_date >= time_filter]
-            logger.info(f"Filtered down to {len(articles)} articles from {original_count} after time filter.")
-            
-            if debug_flag:
-                if articles:
-                    logger.debug(f"First 3 time-filtered articles:")
-                    for i, article in enumerate(articles[:3]):
-                        ticker_str = ', '.join(article.tickers) if article.tickers else "None"
-                        logger.debug(f"{i+1}. {article.title} - {article.published_date} - Tickers: {ticker_str}")
-                else:
-                    logger.debug("No articles found after time-interval filtering.")
-
-    articles_to_pass_to_tui = articles[:args.limit]
-    logger.info(f"Limiting articles to {args.limit}, passing {len(articles_to_pass_to_tui)} to TUI.")
-    
-    if not articles_to_pass_to_tui and (args.stocks or args.time_interval):
-         logger.warning("No news articles found matching specific criteria after filtering and limiting.")
-    elif not articles_to_pass_to_tui:
-         logger.warning("No news articles found from any source after filtering and limiting.")
-    else:
-         logger.info(f"Passing {len(articles_to_pass_to_tui)} articles to the TUI.")
-         if debug_flag:
-             all_tickers_in_tui_set = set()
-             for article in articles_to_pass_to_tui:
-                 if article.tickers:
-                     all_tickers_in_tui_set.update(article.tickers)
-             ticker_summary = ', '.join(all_tickers_in_tui_set) if all_tickers_in_tui_set else "None found"
-             logger.debug(f"Articles for TUI contain these tickers: {ticker_summary}")
-             logger.debug(f"Article data before passing to TUI (first 3):")
-             for i, article in enumerate(articles_to_pass_to_tui[:3]):
-                 logger.debug(f"  Article {i+1}: Title='{article.title}', Date='{article.published_date}', Source='{article.source}', Tickers='{article.tickers}', Summary Length='{len(article.summary) if article.summary else 0}'")
-
-    logger.info(f"Starting TUI with {len(articles_to_pass_to_tui)} articles...")
-    app = NewsTUI(articles=articles_to_pass_to_tui, cli_args=args)
+    logger.info("Starting TUI with articles loading in the background...")
+    # Prices are looked up only for the articles that make it into the TUI, after they are displayed
+    # (mock articles come with their own prices)
+    article_loader = functools.partial(collect_articles, args, stock_symbols_list, debug_flag, use_mock, fetch_prices=False)
+    price_loader = None if use_mock else fetch_article_prices
+    app = NewsTUI(articles=[], cli_args=args, article_loader=article_loader, price_loader=price_loader)
     try:
         app.run()
     except Exception as e:
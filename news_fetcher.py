@@ -1,10 +1,18 @@
 import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+import email.utils # For parsing RSS dates
+import io # For handing cached HTML to pandas
 import json
+import orjson # Fast JSON for the cache files
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, FrozenSet, NamedTuple
 from article import Article
-from datetime import datetime, timedelta
-import time # For parsing dates
+from datetime import datetime, timedelta, timezone
+import calendar # For converting UTC struct_times
+import time # For the in-memory price TTL
 import yfinance as yf # Added yfinance
 import re # For improved ticker matching
 import pandas as pd # For processing stock lists
@@ -13,7 +21,12 @@ import os # For cache file management
 import logging
 import traceback # For logging exceptions
 import concurrent.futures # For parallel processing
+import sqlite3 # For the price cache
+import threading # For guarding the price cache connection
 import functools # For caching
+import itertools # For flattening per-source results
+import hashlib # For stable mock article ids
+import sys # For interning matched tickers
 
 # Initialize colorama - replaced by logger
 # init(autoreset=True)
@@ -23,12 +36,53 @@ logger = logging.getLogger(__name__) # Get logger instance
 SOURCES_FILE = Path(__file__).parent / "sources.json"
 # Path to the stock symbols cache file
 STOCKS_CACHE_FILE = Path(__file__).parent / "stocks_cache.json"
+# Path to the index page cache file (ETag/Last-Modified validators and the HTML of each Wikipedia page)
+INDEX_PAGE_CACHE_FILE = Path(__file__).parent / "index_page_cache.json"
+# Wikipedia pages listing the index components
+SP500_URL = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
+NASDAQ100_URL = "https://en.wikipedia.org/wiki/Nasdaq-100"
 # Path to the price cache file
-PRICE_CACHE_FILE = Path(__file__).parent / "price_cache.json"
+PRICE_CACHE_FILE = Path(__file__).parent / "price_cache.db"
 # Cache expiration in days
 CACHE_EXPIRATION_DAYS = 7
+# Path to the feed cache file (ETag/Last-Modified validators and the articles parsed from each feed)
+FEED_CACHE_FILE = Path(__file__).parent / "feed_cache.json"
+# Seconds to wait for a feed server before giving up on that feed
+FEED_REQUEST_TIMEOUT_SECONDS = 15
 # Price cache expiration in minutes
 PRICE_CACHE_EXPIRATION_MINUTES = 30
+# Expired prices younger than this are still returned when a fresh lookup fails
+PRICE_STALE_MAX_MINUTES = 24 * 60
+# Minutes to skip a ticker after a failed lookup, doubled for each further consecutive failure
+PRICE_FAILURE_BACKOFF_MINUTES = 5
+# Upper bound on the failure backoff
+PRICE_FAILURE_BACKOFF_MAX_MINUTES = 60
+# Seconds a price returned by fetch_current_prices is reused from memory without a cache lookup
+PRICE_MEMORY_TTL_SECONDS = 60
+# Upper bound on concurrent feed downloads
+MAX_FEED_WORKERS = 32
+# Browser-like User-Agent; some feed and quote servers reject the default python-requests one
+HTTP_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+# Yahoo endpoint returning recent closing prices for several symbols in one request
+YAHOO_SPARK_URL = "https://query1.finance.yahoo.com/v8/finance/spark"
+# Maximum symbols per spark request
+SPARK_BATCH_SIZE = 20
+# Concurrent spark requests (each already covers a whole batch of symbols)
+MAX_SPARK_WORKERS = 4
+# Seconds to wait for a quote request
+PRICE_REQUEST_TIMEOUT_SECONDS = 10
+
+# Shared session for feed and quote requests: one retry policy for transient failures, a pool large
+# enough for every concurrent feed download, and keep-alive reuse for repeated requests to one host
+# (the batched Yahoo quote requests); each feed is on its own host, so feeds do not share connections
+_http_session = requests.Session()
+_http_session.headers['User-Agent'] = HTTP_USER_AGENT
+for _scheme in ('http://', 'https://'):
+    _http_session.mount(_scheme, HTTPAdapter(
+        pool_connections=MAX_FEED_WORKERS,
+        pool_maxsize=MAX_FEED_WORKERS,
+        max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    ))
 
 
 def load_sources() -> List[Dict[str, Any]]:
@@ -49,54 +103,210 @@ def load_sources() -> List[Dict[str, Any]]:
         return []
 
 
-def fetch_articles_from_rss(feed_url: str, source_name: str) -> List[Article]:
-    """Fetches and parses articles from an RSS feed."""
+# Load and manage feed cache
+def load_feed_cache() -> Dict[str, Dict]:
+    """Load cached feed validators and articles from file"""
+    if not FEED_CACHE_FILE.exists():
+        return {}
+    
+    try:
+        return orjson.loads(FEED_CACHE_FILE.read_bytes())
+    except Exception as e:
+        logger.warning(f"Error reading feed cache: {e}", exc_info=True)
+        return {}
+
+
+def save_feed_cache(cache: Dict[str, Dict]) -> None:
+    """Save feed cache to file"""
+    try:
+        FEED_CACHE_FILE.write_bytes(orjson.dumps(cache))
+    except Exception as e:
+        logger.error(f"Error saving feed cache: {e}", exc_info=True)
+
+
+# Namespaces of the feed formats parsed directly with lxml
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+DC_NS = "{http://purl.org/dc/elements/1.1/}"
+
+
+def _parse_feed_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom) date into a naive UTC datetime."""
+    if not value:
+        return None
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _child_text(element, *tags: str) -> Optional[str]:
+    """Return the stripped text of the first of the given child tags that has any."""
+    for tag in tags:
+        text = element.findtext(tag)
+        if text and text.strip():
+            return text.strip()
+    return None
+
+
+def _parse_feed_xml(content: bytes, source_name: str) -> Optional[List[Article]]:
+    """Parse an RSS 2.0 or Atom document with lxml.
+    Returns None when the document is not one of those formats, so the caller can fall back to feedparser.
+    """
+    try:
+        root = etree.fromstring(content, parser=etree.XMLParser(resolve_entities=False, no_network=True))
+    except etree.XMLSyntaxError:
+        return None
+
+    if root.tag == 'rss':
+        items, to_article = root.iter('item'), _rss_item_to_article
+    elif root.tag == ATOM_NS + 'feed':
+        items, to_article = root.iter(ATOM_NS + 'entry'), _atom_entry_to_article
+    else:
+        return None
+
+    articles: List[Article] = []
+    for i, item in enumerate(items):
+        # A bad item is skipped on its own; the rest of the feed is still used
+        try:
+            articles.append(to_article(item, source_name))
+        except Exception as item_ex:
+            logger.error(f"Error processing entry {i} from {source_name}: {item_ex}", exc_info=True)
+    return articles
+
+
+def _rss_item_to_article(item, source_name: str) -> Article:
+    """Convert one RSS 2.0 <item> element to an Article."""
+    return Article(
+        title=_child_text(item, 'title') or 'N/A',
+        link=_child_text(item, 'link') or 'N/A',
+        published_date=_parse_feed_date(_child_text(item, 'pubDate', DC_NS + 'date')),
+        summary=_child_text(item, 'description'),
+        source=source_name
+    )
+
+
+def _atom_entry_to_article(entry, source_name: str) -> Article:
+    """Convert one Atom <entry> element to an Article."""
+    link = None
+    for link_element in entry.iter(ATOM_NS + 'link'):
+        if link_element.get('rel', 'alternate') == 'alternate':
+            link = link_element.get('href')
+            break
+    return Article(
+        title=_child_text(entry, ATOM_NS + 'title') or 'N/A',
+        link=link or 'N/A',
+        published_date=_parse_feed_date(_child_text(entry, ATOM_NS + 'published', ATOM_NS + 'updated')),
+        summary=_child_text(entry, ATOM_NS + 'summary', ATOM_NS + 'content'),
+        source=source_name
+    )
+
+
+def _entry_to_article(entry, index: int, source_name: str) -> Optional[Article]:
+    """Convert one feedparser entry to an Article, or None if the entry cannot be processed."""
+    title = getattr(entry, 'title', 'N/A')
+    try:
+        published_dt: Optional[datetime] = None
+        # feedparser normalizes dates to UTC struct_times; keep them as naive UTC like the lxml path
+        published_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+        if published_parsed:
+            try:
+                published_dt = datetime.fromtimestamp(calendar.timegm(published_parsed), timezone.utc).replace(tzinfo=None)
+            except (TypeError, ValueError, OverflowError):
+                logger.warning(f"Could not parse published date for entry {index} from {source_name}", exc_info=True)
+
+        summary = getattr(entry, 'summary', None) or getattr(entry, 'description', None)
+
+        logger.debug("Processing entry %d from %s: %.40s...", index, source_name, title)
+
+        return Article(
+            title=title,
+            link=getattr(entry, 'link', 'N/A'),
+            published_date=published_dt,
+            summary=summary,
+            source=source_name
+        )
+    except Exception as entry_ex:
+        logger.error(f"Error processing entry {index} from {source_name} ('{str(title)[:40]}...'): {entry_ex}", exc_info=True)
+        return None
+
+
+def fetch_articles_from_rss(feed_url: str, source_name: str, feed_cache: Optional[Dict[str, Dict]] = None) -> List[Article]:
+    """Fetches and parses articles from an RSS feed.
+    RSS 2.0 and Atom feeds are parsed directly with lxml; anything else falls back to feedparser.
+    If a feed cache is given, the request is conditional on the cached ETag/Last-Modified values and
+    the cached articles are reused when the server answers 304 Not Modified.
+    """
     articles: List[Article] = []
     logger.info(f"Fetching from RSS: {feed_url} (Source: {source_name})")
+    cached_feed = feed_cache.get(feed_url) if feed_cache is not None else None
     try:
         headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': HTTP_USER_AGENT
         }
+        if cached_feed:
+            if cached_feed.get('etag'):
+                headers['If-None-Match'] = cached_feed['etag']
+            if cached_feed.get('modified'):
+                headers['If-Modified-Since'] = cached_feed['modified']
         logger.debug(f"Attempting to fetch feed from {feed_url} with agent {headers.get('User-Agent')}")
-        feed_data = feedparser.parse(feed_url, agent=headers.get('User-Agent'))
-        status = feed_data.status if hasattr(feed_data, 'status') else 'unknown'
-        logger.debug(f"Feed fetched from {feed_url}. Status: {status}, Entries: {len(feed_data.entries)}")
-
-        if feed_data.bozo:
-            bozo_exception = feed_data.bozo_exception
-            logger.warning(f"Ill-formed feed from {feed_url}. Reason: {bozo_exception}")
+        response = _http_session.get(feed_url, headers=headers, timeout=FEED_REQUEST_TIMEOUT_SECONDS)
+        status = response.status_code
+        logger.debug(f"Feed fetched from {feed_url}. Status: {status}, Bytes: {len(response.content)}")
 
-        for i, entry in enumerate(feed_data.entries):
-            try:
-                published_dt: Optional[datetime] = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    try:
-                        published_dt = datetime.fromtimestamp(time.mktime(entry.published_parsed))
-                    except TypeError:
-                        logger.warning(f"Could not parse published_parsed for entry {i} from {source_name}", exc_info=True)
-                elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                    try:
-                        published_dt = datetime.fromtimestamp(time.mktime(entry.updated_parsed))
-                    except TypeError:
-                        logger.warning(f"Could not parse updated_parsed for entry {i} from {source_name}", exc_info=True)
-
-                summary = getattr(entry, 'summary', None) or getattr(entry, 'description', None)
-                title = getattr(entry, 'title', 'N/A')
-                
-                logger.debug(f"Processing entry {i} from {source_name}: {title[:40]}...")
-                
-                article = Article(
-                    title=title,
-                    link=getattr(entry, 'link', 'N/A'),
-                    published_date=published_dt,
-                    summary=summary,
+        if status == 304 and cached_feed:
+            for cached in cached_feed.get('articles', []):
+                published = cached.get('published_date')
+                articles.append(Article(
+                    title=cached['title'],
+                    link=cached['link'],
+                    published_date=datetime.fromisoformat(published) if published else None,
+                    summary=cached.get('summary'),
                     source=source_name
-                )
-                articles.append(article)
-            except Exception as entry_ex:
-                logger.error(f"Error processing entry {i} from {source_name} ('{title[:40]}...'): {entry_ex}", exc_info=True)
+                ))
+            logger.info(f"Feed not modified, reused {len(articles)} cached articles from {source_name}")
+            return articles
+        response.raise_for_status()
+
+        parsed_articles = _parse_feed_xml(response.content, source_name)
+        if parsed_articles is not None:
+            articles = parsed_articles
+        else:
+            logger.debug(f"Feed from {feed_url} is not plain RSS/Atom, parsing with feedparser")
+            feed_data = feedparser.parse(response.content)
+            logger.debug(f"Feed parsed from {feed_url}. Entries: {len(feed_data.entries)}")
+
+            if feed_data.bozo:
+                bozo_exception = feed_data.bozo_exception
+                logger.warning(f"Ill-formed feed from {feed_url}. Reason: {bozo_exception}")
+
+            articles = [article for article in (_entry_to_article(entry, i, source_name)
+                                                for i, entry in enumerate(feed_data.entries))
+                        if article is not None]
         
         logger.info(f"Successfully processed {len(articles)} articles from {source_name}")
+        
+        etag = response.headers.get('ETag')
+        modified = response.headers.get('Last-Modified')
+        if feed_cache is not None and (etag or modified):
+            feed_cache[feed_url] = {
+                'etag': etag,
+                'modified': modified,
+                'articles': [
+                    {
+                        'title': article.title,
+                        'link': article.link,
+                        'published_date': article.published_date.isoformat() if article.published_date else None,
+                        'summary': article.summary
+                    }
+                    for article in articles
+                ]
+            }
     except Exception as e:
         logger.error(f"Error fetching or parsing RSS feed from {feed_url}: {repr(e)}", exc_info=True)
         # traceback.print_exc() # Already handled by exc_info=True
@@ -104,63 +314,142 @@ def fetch_articles_from_rss(feed_url: str, source_name: str) -> List[Article]:
 
 
 # Load and manage price cache
-def load_price_cache() -> Dict[str, Dict]:
-    """Load cached stock prices from file"""
-    if not PRICE_CACHE_FILE.exists():
+# Prices live in SQLite so each lookup and update touches one row instead of the whole cache
+_price_db: Optional[sqlite3.Connection] = None
+_price_db_lock = threading.Lock()
+
+
+def _price_db_connection() -> sqlite3.Connection:
+    """Open the price cache database on first use. Callers must hold _price_db_lock."""
+    global _price_db
+    if _price_db is None:
+        connection = sqlite3.connect(PRICE_CACHE_FILE, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS prices (ticker TEXT PRIMARY KEY, price REAL NOT NULL, timestamp REAL NOT NULL)")
+        # Consecutive failed lookups per ticker, so delisted or rate-limited symbols are not retried on every call
+        connection.execute("CREATE TABLE IF NOT EXISTS price_failures (ticker TEXT PRIMARY KEY, failures INTEGER NOT NULL, timestamp REAL NOT NULL)")
+        connection.commit()
+        _price_db = connection
+    return _price_db
+
+
+def get_cached_prices(ticker_symbols: List[str], max_age_minutes: int = PRICE_CACHE_EXPIRATION_MINUTES) -> Dict[str, float]:
+    """Get the cached prices that are still valid (within max_age_minutes) for the given tickers"""
+    if not ticker_symbols:
         return {}
     
+    oldest_valid = (datetime.now() - timedelta(minutes=max_age_minutes)).timestamp()
+    placeholders = ','.join('?' * len(ticker_symbols))
     try:
-        with open(PRICE_CACHE_FILE, 'r', encoding='utf-8') as f:
-            cache = json.load(f)
-            return cache
-    except Exception as e:
+        with _price_db_lock:
+            rows = _price_db_connection().execute(
+                f"SELECT ticker, price FROM prices WHERE timestamp >= ? AND ticker IN ({placeholders})",
+                (oldest_valid, *ticker_symbols)
+            ).fetchall()
+        return dict(rows)
+    except sqlite3.Error as e:
         logger.warning(f"Error reading price cache: {e}", exc_info=True)
         return {}
 
 
-def save_price_cache(cache: Dict[str, Dict]) -> None:
-    """Save price cache to file"""
+def get_cached_price(ticker: str) -> Optional[float]:
+    """Get price from cache if valid"""
+    return get_cached_prices([ticker]).get(ticker)
+
+
+def save_prices(prices: Dict[str, float]) -> None:
+    """Store freshly fetched prices in the cache"""
+    if not prices:
+        return
+    
+    now_timestamp = datetime.now().timestamp()
     try:
-        with open(PRICE_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2)
-    except Exception as e:
+        with _price_db_lock:
+            connection = _price_db_connection()
+            connection.executemany(
+                "INSERT OR REPLACE INTO prices (ticker, price, timestamp) VALUES (?, ?, ?)",
+                [(ticker, price, now_timestamp) for ticker, price in prices.items()]
+            )
+            connection.executemany("DELETE FROM price_failures WHERE ticker = ?", [(ticker,) for ticker in prices])
+            connection.commit()
+    except sqlite3.Error as e:
         logger.error(f"Error saving price cache: {e}", exc_info=True)
 
 
-def get_cached_price(ticker: str, cache: Dict[str, Dict]) -> Optional[float]:
-    """Get price from cache if valid"""
-    if ticker not in cache:
-        return None
+def record_price_failure(ticker: str) -> None:
+    """Count a failed price lookup for the ticker, extending how long it is skipped"""
+    try:
+        with _price_db_lock:
+            connection = _price_db_connection()
+            connection.execute(
+                "INSERT INTO price_failures (ticker, failures, timestamp) VALUES (?, 1, ?) "
+                "ON CONFLICT(ticker) DO UPDATE SET failures = failures + 1, timestamp = excluded.timestamp",
+                (ticker, datetime.now().timestamp())
+            )
+            connection.commit()
+    except sqlite3.Error as e:
+        logger.error(f"Error saving price failure for {ticker}: {e}", exc_info=True)
+
+
+def get_backed_off_tickers(ticker_symbols: List[str]) -> FrozenSet[str]:
+    """Get the tickers whose last lookup failed too recently to try again.
+    The wait starts at PRICE_FAILURE_BACKOFF_MINUTES and doubles per consecutive failure, up to
+    PRICE_FAILURE_BACKOFF_MAX_MINUTES.
+    """
+    if not ticker_symbols:
+        return frozenset()
     
-    cache_time = cache[ticker].get('timestamp')
-    if not cache_time:
-        return None
+    placeholders = ','.join('?' * len(ticker_symbols))
+    try:
+        with _price_db_lock:
+            rows = _price_db_connection().execute(
+                f"SELECT ticker, failures, timestamp FROM price_failures WHERE ticker IN ({placeholders})",
+                tuple(ticker_symbols)
+            ).fetchall()
+    except sqlite3.Error as e:
+        logger.warning(f"Error reading price failures: {e}", exc_info=True)
+        return frozenset()
     
-    # Check if cache is still valid (within PRICE_CACHE_EXPIRATION_MINUTES)
-    cache_dt = datetime.fromtimestamp(cache_time)
-    if datetime.now() - cache_dt > timedelta(minutes=PRICE_CACHE_EXPIRATION_MINUTES):
-        return None
-        
-    return cache[ticker].get('price')
+    now_timestamp = datetime.now().timestamp()
+    backed_off = set()
+    for ticker, failures, timestamp in rows:
+        backoff_minutes = min(PRICE_FAILURE_BACKOFF_MINUTES * 2 ** (failures - 1), PRICE_FAILURE_BACKOFF_MAX_MINUTES)
+        if now_timestamp - timestamp < backoff_minutes * 60:
+            backed_off.add(ticker)
+    return frozenset(backed_off)
+
 
+# Prices handed out by fetch_current_prices in this process: ticker -> (price, time.monotonic() when stored)
+_recent_prices: Dict[str, Tuple[float, float]] = {}
 
-def fetch_single_ticker_price(ticker: str, price_cache: Dict[str, Dict]) -> Optional[float]:
-    """Fetch price for a single ticker, with caching"""
+
+def fetch_single_ticker_price(ticker: str) -> Optional[float]:
+    """Fetch price for a single ticker, with caching.
+    Failed lookups back off before the ticker is tried again; meanwhile, and whenever a lookup fails,
+    a stale price (within PRICE_STALE_MAX_MINUTES) is returned if one is cached.
+    """
     # Check cache first
-    cached_price = get_cached_price(ticker, price_cache)
+    cached_price = get_cached_price(ticker)
     if cached_price is not None:
         logger.debug(f"Using cached price for {ticker}: {cached_price}")
         return cached_price
     
+    if ticker in get_backed_off_tickers([ticker]):
+        logger.debug(f"Skipping price lookup for {ticker} after recent failures")
+        return get_cached_prices([ticker], PRICE_STALE_MAX_MINUTES).get(ticker)
+    
     try:
         ticker_obj = yf.Ticker(ticker)
-        info = ticker_obj.info
-        current_price = info.get('currentPrice') or \
-                        info.get('regularMarketPrice') or \
-                        info.get('previousClose')
+        current_price = None
+        try:
+            # fast_info reads a couple of fields instead of the full quoteSummary blob behind .info
+            fast_info = ticker_obj.fast_info
+            current_price = fast_info.get('last_price') or fast_info.get('previous_close')
+        except Exception as fast_info_error:
+            logger.debug(f"fast_info failed for {ticker}: {fast_info_error}")
 
         if current_price is None:
-            logger.debug(f"Current price not in info for {ticker}, trying history.")
+            logger.debug(f"Current price not in fast_info for {ticker}, trying history.")
             hist = ticker_obj.history(period="2d")
             if not hist.empty and 'Close' in hist.columns:
                 current_price = hist['Close'].iloc[-1]
@@ -168,54 +457,111 @@ def fetch_single_ticker_price(ticker: str, price_cache: Dict[str, Dict]) -> Opti
         if current_price is not None:
             price = float(current_price)
             # Update cache
-            price_cache[ticker] = {
-                'price': price,
-                'timestamp': datetime.now().timestamp()
-            }
+            save_prices({ticker: price})
             logger.debug(f"Fetched price for {ticker}: {price}")
             return price
         else:
             logger.warning(f"Could not fetch price for {ticker} after multiple attempts.")
-            return None
     except Exception as e:
         logger.error(f"Error fetching price for {ticker} with yfinance: {e}", exc_info=True)
-        return None
+    
+    record_price_failure(ticker)
+    return get_cached_prices([ticker], PRICE_STALE_MAX_MINUTES).get(ticker)
+
+
+def fetch_spark_prices(ticker_symbols: List[str]) -> Dict[str, float]:
+    """Fetch the latest price for a batch of tickers (at most SPARK_BATCH_SIZE) with a single Yahoo spark request."""
+    prices: Dict[str, float] = {}
+    try:
+        response = _http_session.get(
+            YAHOO_SPARK_URL,
+            params={'symbols': ','.join(ticker_symbols), 'range': '1d', 'interval': '5m'},
+            timeout=PRICE_REQUEST_TIMEOUT_SECONDS
+        )
+        response.raise_for_status()
+        spark_data = response.json()
+    except Exception as e:
+        logger.warning(f"Spark price request failed for {ticker_symbols}: {e}", exc_info=True)
+        return prices
+    
+    for ticker in ticker_symbols:
+        closes = (spark_data.get(ticker) or {}).get('close') or []
+        # The newest interval's close is null until it has trades, so take the last real value
+        last_close = next((close for close in reversed(closes) if close is not None), None)
+        if last_close is not None:
+            prices[ticker] = float(last_close)
+    logger.debug(f"Spark request returned prices for {len(prices)} of {len(ticker_symbols)} tickers")
+    return prices
 
 
 def fetch_current_prices(ticker_symbols: List[str]) -> Dict[str, float]:
-    """Fetches current prices for a list of stock tickers using yfinance, with parallel requests and caching."""
+    """Fetches current prices for a list of stock tickers, with caching.
+    Prices returned within the last PRICE_MEMORY_TTL_SECONDS are reused from memory; the rest are read from
+    the price cache, and uncached tickers are fetched in batches from the Yahoo spark endpoint; any it misses
+    fall back to yfinance one by one.
+    """
     prices: Dict[str, float] = {}
     if not ticker_symbols:
         return prices
     
     logger.debug(f"Fetching current prices for tickers: {ticker_symbols}")
     
-    # Load price cache
-    price_cache = load_price_cache()
+    now = time.monotonic()
+    for ticker in ticker_symbols:
+        recent = _recent_prices.get(ticker)
+        if recent is not None and now - recent[1] < PRICE_MEMORY_TTL_SECONDS:
+            prices[ticker] = recent[0]
+    lookup_tickers = [ticker for ticker in ticker_symbols if ticker not in prices]
+    if not lookup_tickers:
+        logger.debug(f"All {len(prices)} prices reused from memory")
+        return prices
     
-    # Use ThreadPoolExecutor for parallel fetching
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        # Create a partial function with the price_cache parameter
-        fetch_with_cache = functools.partial(fetch_single_ticker_price, price_cache=price_cache)
-        
-        # Map tickers to their fetched prices in parallel
-        future_to_ticker = {executor.submit(fetch_with_cache, ticker): ticker for ticker in ticker_symbols}
-        
-        for future in concurrent.futures.as_completed(future_to_ticker):
-            ticker = future_to_ticker[future]
-            try:
-                price = future.result()
-                if price is not None:
-                    prices[ticker] = price
-            except Exception as e:
-                logger.error(f"Exception when fetching price for {ticker}: {e}", exc_info=True)
+    # Then the cached prices
+    prices.update(get_cached_prices(lookup_tickers))
+    cache_hits = len(prices) - (len(ticker_symbols) - len(lookup_tickers))
+    # Tickers that failed recently are not requested again until their backoff ends
+    backed_off_tickers = get_backed_off_tickers([ticker for ticker in lookup_tickers if ticker not in prices])
+    uncached_tickers = [ticker for ticker in lookup_tickers if ticker not in prices and ticker not in backed_off_tickers]
+    logger.info(f"Price memory hits: {len(ticker_symbols) - len(lookup_tickers)}, "
+                f"cache hits: {cache_hits}/{len(lookup_tickers)} ({cache_hits / len(lookup_tickers):.0%}), "
+                f"{len(backed_off_tickers)} skipped after recent failures")
+    if backed_off_tickers:
+        prices.update(get_cached_prices(list(backed_off_tickers), PRICE_STALE_MAX_MINUTES))
     
-    # Save updated cache
-    save_price_cache(price_cache)
+    if uncached_tickers:
+        batches = [uncached_tickers[i:i + SPARK_BATCH_SIZE] for i in range(0, len(uncached_tickers), SPARK_BATCH_SIZE)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(MAX_SPARK_WORKERS, len(batches))) as executor:
+            for batch_prices in executor.map(fetch_spark_prices, batches):
+                prices.update(batch_prices)
+                save_prices(batch_prices)
     
+    missing_tickers = [ticker for ticker in uncached_tickers if ticker not in prices]
+    if missing_tickers:
+        logger.debug(f"Falling back to per-ticker price lookups for: {missing_tickers}")
+        # Use ThreadPoolExecutor for parallel fetching
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            # Map tickers to their fetched prices in parallel
+            future_to_ticker = {executor.submit(fetch_single_ticker_price, ticker): ticker for ticker in missing_tickers}
+            
+            for future in concurrent.futures.as_completed(future_to_ticker):
+                ticker = future_to_ticker[future]
+                try:
+                    price = future.result()
+                    if price is not None:
+                        prices[ticker] = price
+                except Exception as e:
+                    logger.error(f"Exception when fetching price for {ticker}: {e}", exc_info=True)
+    
+    now = time.monotonic()
+    _recent_prices.update((ticker, (prices[ticker], now)) for ticker in lookup_tickers if ticker in prices)
     return prices
 
 
+def _stable_id(text: str) -> str:
+    """Short digest of text that, unlike hash(), is the same in every run."""
+    return hashlib.blake2s(text.encode("utf-8"), digest_size=4).hexdigest()
+
+
 def generate_mock_articles() -> List[Article]:
     """Generates mock articles for testing purposes."""
     logger.info("Generating mock articles for testing...")
@@ -249,7 +595,7 @@ def generate_mock_articles() -> List[Article]:
         published_date = now - timedelta(hours=data["hours_ago"])
         article = Article(
             title=data["title"],
-            link=f"https://example.com/mock-article-{abs(hash(data['title'])) % 10000}", # abs for hash
+            link=f"https://example.com/mock-article-{_stable_id(data['title'])}",
             published_date=published_date,
             summary=data["summary"],
             source=data["source"],
@@ -263,6 +609,51 @@ def generate_mock_articles() -> List[Article]:
     return articles
 
 
+# Load and manage index page cache
+def load_index_page_cache() -> Dict[str, Dict]:
+    """Load cached index page validators and HTML from file"""
+    if not INDEX_PAGE_CACHE_FILE.exists():
+        return {}
+    
+    try:
+        return orjson.loads(INDEX_PAGE_CACHE_FILE.read_bytes())
+    except Exception as e:
+        logger.warning(f"Error reading index page cache: {e}", exc_info=True)
+        return {}
+
+
+def save_index_page_cache(cache: Dict[str, Dict]) -> None:
+    """Save index page cache to file"""
+    try:
+        INDEX_PAGE_CACHE_FILE.write_bytes(orjson.dumps(cache))
+    except Exception as e:
+        logger.error(f"Error saving index page cache: {e}", exc_info=True)
+
+
+def fetch_index_page(url: str, page_cache: Dict[str, Dict]) -> Tuple[str, bool]:
+    """Fetch the HTML of an index page, conditional on the validators cached for it.
+    Returns the HTML and whether it changed; on 304 Not Modified the cached HTML is reused.
+    """
+    cached_page = page_cache.get(url)
+    headers = {'User-Agent': HTTP_USER_AGENT}
+    if cached_page:
+        if cached_page.get('etag'):
+            headers['If-None-Match'] = cached_page['etag']
+        if cached_page.get('modified'):
+            headers['If-Modified-Since'] = cached_page['modified']
+    response = _http_session.get(url, headers=headers, timeout=FEED_REQUEST_TIMEOUT_SECONDS)
+    if response.status_code == 304 and cached_page:
+        logger.info(f"Index page not modified: {url}")
+        return cached_page['html'], False
+    response.raise_for_status()
+    
+    etag = response.headers.get('ETag')
+    modified = response.headers.get('Last-Modified')
+    if etag or modified:
+        page_cache[url] = {'etag': etag, 'modified': modified, 'html': response.text}
+    return response.text, True
+
+
 def fetch_major_stocks() -> Dict[str, str]:
     """
     Fetches NASDAQ and S&P 500 stocks and maps tickers to company names.
@@ -278,26 +669,41 @@ def fetch_major_stocks() -> Dict[str, str]:
             cache_age = datetime.now() - datetime.fromtimestamp(cache_stat.st_mtime)
             if cache_age.days < CACHE_EXPIRATION_DAYS:
                 logger.info(f"Using cached stock symbols (age: {cache_age.days} days)")
-                with open(STOCKS_CACHE_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return orjson.loads(STOCKS_CACHE_FILE.read_bytes())
         except Exception as e:
             logger.warning(f"Error reading cache file: {e}", exc_info=True)
     
     logger.info("Fetching major stock indices (NASDAQ and S&P 500)")
     stock_map = {}
+    page_cache = load_index_page_cache()
     
     try:
+        sp500_html, sp500_changed = fetch_index_page(SP500_URL, page_cache)
+        try:
+            nasdaq_html, nasdaq_changed = fetch_index_page(NASDAQ100_URL, page_cache)
+        except Exception as nasdaq_error:
+            logger.error(f"Error fetching NASDAQ page: {nasdaq_error}", exc_info=True)
+            nasdaq_html, nasdaq_changed = None, True
+        save_index_page_cache(page_cache)
+        
+        # Neither page changed, so the cached map is still current; renew it without re-parsing the tables
+        if not sp500_changed and not nasdaq_changed and STOCKS_CACHE_FILE.exists():
+            try:
+                stock_map = orjson.loads(STOCKS_CACHE_FILE.read_bytes())
+                STOCKS_CACHE_FILE.touch()
+                logger.info("Index pages unchanged, renewed cached stock symbols")
+                return stock_map
+            except Exception as e:
+                logger.warning(f"Error reading cache file: {e}", exc_info=True)
+        
         # Fetch S&P 500 components
-        sp500 = pd.read_html("https://en.wikipedia.org/wiki/List_of_S%26P_500_companies")[0]
-        for idx, row in sp500.iterrows():
-            ticker = row['Symbol']
-            company = row['Security']
-            stock_map[ticker] = company
+        sp500 = pd.read_html(io.StringIO(sp500_html))[0]
+        stock_map.update(zip(sp500['Symbol'].to_numpy(), sp500['Security'].to_numpy()))
         logger.info(f"Fetched {len(sp500)} S&P 500 companies")
         
         # Fetch NASDAQ components (this may contain duplicates with S&P 500)
         try:
-            nasdaq_tables = pd.read_html("https://en.wikipedia.org/wiki/Nasdaq-100")
+            nasdaq_tables = pd.read_html(io.StringIO(nasdaq_html)) if nasdaq_html is not None else []
             # Find the right table - inspect column names
             for table_idx, table in enumerate(nasdaq_tables):
                 logger.debug(f"NASDAQ table {table_idx} columns: {list(table.columns)}")
@@ -318,10 +724,7 @@ def fetch_major_stocks() -> Dict[str, str]:
                 # If we found both columns, use this table
                 if ticker_col and company_col:
                     logger.info(f"Using NASDAQ table {table_idx} with columns {ticker_col} and {company_col}")
-                    for idx, row in table.iterrows():
-                        ticker = row[ticker_col]
-                        company = row[company_col]
-                        stock_map[ticker] = company
+                    stock_map.update(zip(table[ticker_col].to_numpy(), table[company_col].to_numpy()))
                     break
             
             logger.info(f"Total unique tickers after adding NASDAQ: {len(stock_map)}")
@@ -329,8 +732,8 @@ def fetch_major_stocks() -> Dict[str, str]:
             logger.error(f"Error processing NASDAQ table: {nasdaq_error}", exc_info=True)
         
         # Cache the results
-        with open(STOCKS_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(stock_map, f, indent=2)
+        # Scraped table cells are not guaranteed to be strings; write them as keys like json.dump did
+        STOCKS_CACHE_FILE.write_bytes(orjson.dumps(stock_map, option=orjson.OPT_NON_STR_KEYS))
         logger.info(f"Cached stock symbols to {STOCKS_CACHE_FILE}")
         
     except Exception as e:
@@ -339,8 +742,7 @@ def fetch_major_stocks() -> Dict[str, str]:
         if STOCKS_CACHE_FILE.exists():
             logger.warning("Using expired cache due to fetch error")
             try:
-                with open(STOCKS_CACHE_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return orjson.loads(STOCKS_CACHE_FILE.read_bytes())
             except Exception as cache_e:
                 logger.error(f"Error reading cache file: {cache_e}", exc_info=True)
         
@@ -368,8 +770,8 @@ def fetch_major_stocks() -> Dict[str, str]:
 
 
 # Precompile commonly used regex patterns for better performance
-TICKER_PATTERN = re.compile(r'\$([A-Z]{1,5})\b')
-PARENS_TICKER_PATTERN = re.compile(r'\(([A-Z]{1,5})\)')
+# $TICKER and (TICKER) forms in one alternation, so the text is scanned once for both
+MARKED_TICKER_PATTERN = re.compile(r'\$([A-Z]{1,5})\b|\(([A-Z]{1,5})\)')
 
 # Define common word tickers that need special handling
 COMMON_WORD_TICKERS = {
@@ -379,43 +781,232 @@ COMMON_WORD_TICKERS = {
     'BILL': True, 'BIG': True, 'GOOD': True, 'LOW': True, 'WELL': True,
 }
 
+# Words that show a common-word ticker is actually used in a financial sense
+FINANCIAL_CONTEXT_WORDS = ("stock", "share", "price", "market", "investor", "trading",
+                           "nasdaq", "nyse", "exchange", "financ", "earn", "revenue")
+
+
+def _trie_pattern(words) -> str:
+    """Build a regex alternation of non-empty literal words with shared prefixes factored out.
+    Each step is a single character test instead of trying every word in turn, and the
+    greedy optional groups make the longest word at a position win.
+    """
+    trie: Dict[str, Dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # A word ends here
+
+    def build(node: Dict[str, Dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + pattern + ')?' if '' in node else pattern
+
+    return build(trie)
+
+
+def _prefix_closure(word_values: Dict[str, set]) -> Dict[str, FrozenSet[str]]:
+    """For each word, the union of the values of every word that is a prefix of it (itself included).
+    A scan reporting only the longest word at each position still yields the shorter words starting there.
+    """
+    return {
+        word: frozenset().union(*(values for other, values in word_values.items() if word.startswith(other)))
+        for word in word_values
+    }
+
 
 def fetch_articles_in_parallel(sources: List[Dict[str, Any]]) -> List[Article]:
-    """Fetch articles from multiple sources in parallel"""
-    all_articles = []
+    """Fetch articles from multiple sources in parallel.
+    Feeds download concurrently, but results are combined in the order the sources are configured.
+    """
+    rss_sources = [
+        (source_config["url"], source_config.get('name', 'Unknown Source'))
+        for source_config in sources
+        if source_config.get("type") == "rss" and "url" in source_config
+    ]
+    if not rss_sources:
+        return []
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_source = {}
-        
-        for source_config in sources:
-            name = source_config.get('name', 'Unknown Source')
-            if source_config.get("type") == "rss" and "url" in source_config:
-                future = executor.submit(fetch_articles_from_rss, source_config["url"], name)
-                future_to_source[future] = name
+    # Load feed cache; each worker only touches its own feed's entry
+    feed_cache = load_feed_cache()
+    
+    # Feed fetching is network-bound, so use one thread per feed (capped) rather than a fixed pool size
+    max_workers = min(MAX_FEED_WORKERS, len(rss_sources))
+    results: List[List[Article]] = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(executor.submit(fetch_articles_from_rss, url, name, feed_cache), name) for url, name in rss_sources]
         
-        for future in concurrent.futures.as_completed(future_to_source):
-            source_name = future_to_source[future]
+        for future, source_name in futures:
             try:
                 source_articles = future.result()
-                all_articles.extend(source_articles)
+                results.append(source_articles)
                 logger.info(f"Added {len(source_articles)} articles from {source_name}")
             except Exception as e:
                 logger.error(f"Error getting articles from {source_name}: {e}", exc_info=True)
     
-    return all_articles
+    # Save updated cache
+    save_feed_cache(feed_cache)
+    
+    return list(itertools.chain.from_iterable(results))
+
+
+class _TickerMatchers(NamedTuple):
+    """Per-ticker patterns and lookup tables used to score articles against a list of symbols."""
+    company_regexes: Dict[str, re.Pattern]
+    company_alias_regexes: Dict[str, Tuple[re.Pattern, ...]]
+    alias_candidates: Dict[str, FrozenSet[str]]
+    company_scan_regex: Optional[re.Pattern]
+    ticker_lowers: Dict[str, str]
+    ticker_order: Dict[str, int]
+    scannable_tickers: FrozenSet[str]
+    literal_candidates: Dict[str, FrozenSet[str]]
+    ticker_scan_regex: Optional[re.Pattern]
+    exact_ticker_regexes: Dict[str, re.Pattern]
+    summary_ticker_regexes: Dict[str, re.Pattern]
+    prefilter_terms: Tuple[str, ...]
+    prefilter_first_chars: FrozenSet[str]
 
 
-def fetch_all_news(stock_symbols: Optional[List[str]] = None, source_limit: Optional[int] = None, use_mock: bool = False) -> List[Article]:
+@functools.lru_cache(maxsize=8)
+def _build_ticker_matchers(symbols_to_scan: Tuple[str, ...], company_names: Tuple[Tuple[str, str], ...]) -> _TickerMatchers:
+    """Build the matchers for the given symbols and their (ticker, company name) pairs.
+    Cached, so repeated fetches for the same symbols skip pattern construction and compilation.
+    The returned structures are shared between calls and must not be modified.
+    """
+    # Collect lowercase company names/aliases for each ticker based on stock map
+    company_aliases = {}
+    for ticker, company in company_names:
+        name_parts = company.split()
+        main_name = name_parts[0].lower()  # First word usually has the company name
+        
+        # Handle special cases and common nicknames
+        if ticker == 'AAPL' or 'Apple' in company:
+            aliases = ['apple']
+        elif ticker == 'MSFT' or 'Microsoft' in company:
+            aliases = ['microsoft']
+        elif ticker == 'GOOG' or ticker == 'GOOGL' or 'Google' in company or 'Alphabet' in company:
+            aliases = ['google', 'alphabet']
+        elif ticker == 'AMZN' or 'Amazon' in company:
+            aliases = ['amazon']
+        elif ticker == 'META' or 'Meta' in company or 'Facebook' in company:
+            aliases = ['meta', 'facebook']
+        elif ticker == 'TSLA' or 'Tesla' in company:
+            aliases = ['tesla', 'musk']  # Elon Musk is often mentioned with Tesla
+        elif ticker == 'NVDA' or 'NVIDIA' in company:
+            aliases = ['nvidia']
+        else:
+            # For other companies, use the company name
+            aliases = [main_name]
+            
+            # If company name has multiple parts, add the full name too
+            if len(name_parts) > 1:
+                aliases.append(company.lower())
+        
+        company_aliases[ticker] = aliases
+    
+    # Compile every per-ticker pattern once up front instead of on each article pass.
+    # A ticker's alternatives are unioned into a single regex so one scan covers them all.
+    # Article text is lowercased before matching, so patterns are lowercase and case sensitive.
+    company_regexes = {
+        ticker: re.compile('|'.join(r'\b' + re.escape(alias) + r'\b' for alias in aliases))
+        for ticker, aliases in company_aliases.items()
+    }
+    # The summary frequency bonus counts mentions of the first alias found, so each alias also gets its own regex
+    company_alias_regexes = {
+        ticker: tuple(re.compile(r'\b' + re.escape(alias) + r'\b') for alias in aliases)
+        for ticker, aliases in company_aliases.items()
+    }
+    
+    # One combined scan over every company alias tells us which tickers can possibly match
+    # an article, so the per-ticker company regexes only run for those candidates.
+    # The lookahead reports the longest alias starting at each position; any shorter alias
+    # matching at the same position is a prefix of it, so each alias also maps to the
+    # tickers of all its prefix aliases.
+    alias_tickers = {}
+    for ticker, aliases in company_aliases.items():
+        for alias in aliases:
+            if alias:
+                alias_tickers.setdefault(alias, set()).add(ticker)
+    alias_candidates = _prefix_closure(alias_tickers)
+    company_scan_regex = None
+    if alias_candidates:
+        company_scan_regex = re.compile(r'(?=(\b' + _trie_pattern(alias_candidates) + r'\b))')
+    
+    # Likewise one scan over the lowercased ticker literals finds the only tickers that can score
+    # from their symbol, so the per-ticker checks in fetch_all_news skip every ticker absent from the text.
+    # Single-letter tickers are never checked per ticker and are left out.
+    ticker_lowers = {ticker: ticker.lower() for ticker in symbols_to_scan}
+    literal_tickers = {}
+    ticker_order = {}
+    for position, ticker in enumerate(symbols_to_scan):
+        ticker_order.setdefault(ticker, position)
+        if len(ticker) > 1:
+            literal_tickers.setdefault(ticker_lowers[ticker], set()).add(ticker)
+    scannable_tickers = frozenset().union(*literal_tickers.values())
+    literal_candidates = _prefix_closure(literal_tickers)
+    ticker_scan_regex = None
+    if literal_candidates:
+        ticker_scan_regex = re.compile('(?=(' + _trie_pattern(literal_candidates) + '))')
+    
+    exact_ticker_regexes = {}
+    summary_ticker_regexes = {}
+    for ticker in symbols_to_scan:
+        if ticker in COMMON_WORD_TICKERS:
+            escaped = re.escape(ticker)
+            # Exact match, case sensitive, not followed by another letter/digit
+            exact_ticker_regexes[ticker] = re.compile(escaped + r'(?=[^a-zA-Z0-9]|$)')
+            # Only exact ticker references with $ prefix or in specific financial contexts
+            # (matched against the lowercased summary)
+            escaped_lower = re.escape(ticker.lower())
+            summary_ticker_regexes[ticker] = re.compile(
+                r'\$' + escaped_lower + r'\b'
+                r'|\(' + escaped_lower + r'\)'
+                r'|ticker[s]?[\s:]+' + escaped_lower + r'\b'
+                r'|stock[s]?[\s:]+' + escaped_lower + r'\b'
+                r'|symbol[\s:]+' + escaped_lower + r'\b'
+                r'|shares? of ' + escaped_lower + r'\b'
+            )
+    
+    # Literal strings of which at least one must appear in an article's lowercased text for any
+    # ticker to score. Most articles contain none of them and can skip the regex checks entirely.
+    prefilter_terms = set(alias_tickers)
+    for ticker in symbols_to_scan:
+        ticker_lower = ticker.lower()
+        if len(ticker) == 1:
+            # Single letters are only ever matched as $X or (X)
+            prefilter_terms.update(('$' + ticker_lower, '(' + ticker_lower + ')'))
+        else:
+            prefilter_terms.add(ticker_lower)
+    prefilter_terms = tuple(prefilter_terms)
+    prefilter_first_chars = frozenset(term[0] for term in prefilter_terms)
+    
+    return _TickerMatchers(
+        company_regexes, company_alias_regexes, alias_candidates, company_scan_regex, ticker_lowers, ticker_order,
+        scannable_tickers, literal_candidates, ticker_scan_regex, exact_ticker_regexes, summary_ticker_regexes,
+        prefilter_terms, prefilter_first_chars
+    )
+
+
+def fetch_all_news(stock_symbols: Optional[List[str]] = None, source_limit: Optional[int] = None, use_mock: bool = False,
+                   published_since: Optional[datetime] = None, fetch_prices: bool = True) -> List[Article]:
     """
     Fetches news from all configured sources or generates mock articles.
     Filters by stock symbols if provided.
+    If published_since is given, older and undated articles are dropped before the ticker scan.
+    With fetch_prices=False the articles are returned without prices; attach_current_prices can add them later.
     """
     if use_mock:
         logger.info("Using mock articles as requested.")
         articles_to_return = generate_mock_articles()
+        if published_since is not None:
+            articles_to_return = [article for article in articles_to_return if article.published_date >= published_since]
+            logger.debug(f"{len(articles_to_return)} mock articles were published since {published_since}.")
         if stock_symbols:
             logger.debug(f"Filtering {len(articles_to_return)} mock articles for symbols: {stock_symbols}")
-            articles_to_return = [article for article in articles_to_return if article.tickers and any(s in article.tickers for s in stock_symbols)]
+            articles_to_return = [article for article in articles_to_return if not article.ticker_set.isdisjoint(stock_symbols)]
             logger.debug(f"{len(articles_to_return)} mock articles remained after filtering by symbols.")
         return articles_to_return
     
@@ -438,6 +1029,13 @@ def fetch_all_news(stock_symbols: Optional[List[str]] = None, source_limit: Opti
         return []
     logger.info(f"Fetched {len(all_articles)} articles from all real sources before stock symbol filtering.")
 
+    if published_since is not None:
+        # The caller drops articles outside its time window anyway, so skip scanning and pricing them
+        all_articles = [article for article in all_articles if article.published_date and article.published_date >= published_since]
+        logger.info(f"{len(all_articles)} articles were published since {published_since}.")
+        if not all_articles:
+            return []
+
     # Get stock ticker to company name mapping
     stock_map = fetch_major_stocks()
     
@@ -470,170 +1068,148 @@ def fetch_all_news(stock_symbols: Optional[List[str]] = None, source_limit: Opti
     
     logger.info(f"Analyzing {len(all_articles)} articles for stock symbols: {symbols_to_scan[:10]}... (total: {len(symbols_to_scan)})")
     processed_articles: List[Article] = []
+    # Hash lookups for the membership tests below; symbols_to_scan keeps its order for tie-breaking
+    symbols_to_scan_set = frozenset(symbols_to_scan)
     
-    # Create patterns for company names based on stock map
-    company_patterns = {}
-    for ticker, company in stock_map.items():
-        if ticker in symbols_to_scan:
-            # Create patterns for this company name
-            name_parts = company.split()
-            main_name = name_parts[0].lower()  # First word usually has the company name
-            
-            # Handle special cases and common nicknames
-            if ticker == 'AAPL' or 'Apple' in company:
-                patterns = [r'\bapple\b']
-            elif ticker == 'MSFT' or 'Microsoft' in company:
-                patterns = [r'\bmicrosoft\b']
-            elif ticker == 'GOOG' or ticker == 'GOOGL' or 'Google' in company or 'Alphabet' in company:
-                patterns = [r'\bgoogle\b', r'\balphabet\b']
-            elif ticker == 'AMZN' or 'Amazon' in company:
-                patterns = [r'\bamazon\b']
-            elif ticker == 'META' or 'Meta' in company or 'Facebook' in company:
-                patterns = [r'\bmeta\b', r'\bfacebook\b']
-            elif ticker == 'TSLA' or 'Tesla' in company:
-                patterns = [r'\btesla\b', r'\bmusk\b']  # Elon Musk is often mentioned with Tesla
-            elif ticker == 'NVDA' or 'NVIDIA' in company:
-                patterns = [r'\bnvidia\b']
-            else:
-                # For other companies, use the company name
-                # Escape any regex special characters in the company name
-                escaped_name = re.escape(main_name)
-                patterns = [r'\b' + escaped_name + r'\b']
-                
-                # If company name has multiple parts, add the full name too
-                if len(name_parts) > 1:
-                    full_name = re.escape(company.lower())
-                    patterns.append(r'\b' + full_name + r'\b')
-            
-            company_patterns[ticker] = patterns
+    # Patterns and lookup tables for these symbols, built once and reused by later calls
+    company_names = tuple((ticker, stock_map[ticker]) for ticker in symbols_to_scan_set if ticker in stock_map)
+    (company_regexes, company_alias_regexes, alias_candidates, company_scan_regex, ticker_lowers, ticker_order,
+     scannable_tickers, literal_candidates, ticker_scan_regex, exact_ticker_regexes, summary_ticker_regexes,
+     prefilter_terms, prefilter_first_chars) = _build_ticker_matchers(tuple(symbols_to_scan), tuple(sorted(company_names)))
+    
+    # Ticker scores and primary ticker by (title, summary)
+    score_cache: Dict[Tuple[Optional[str], Optional[str]], Tuple[Dict[str, int], Optional[str]]] = {}
     
     # First pass: fast scan using optimized regex for ticker symbols
     for article in all_articles:
-        title_text = article.title.lower() if article.title else ""
-        summary_text = article.summary.lower() if article.summary else ""
-        full_text = title_text + " " + summary_text
+        full_text = article.search_text
+        
+        if prefilter_first_chars.isdisjoint(full_text) or not any(term in full_text for term in prefilter_terms):
+            # No ticker or company name can match; such articles are only kept when no symbols were requested
+            if not stock_symbols:
+                processed_articles.append(article)
+            continue
         
-        # Track ticker occurrences with a score to prioritize those most likely to be the main subject
-        ticker_scores = {}
-        primary_ticker = None
-        highest_score = 0
+        # Wire copies and feed echoes repeat the same title and summary; score each distinct text only once
+        score_key = (article.title, article.summary)
+        cached_scores = score_cache.get(score_key)
+        if cached_scores is not None:
+            ticker_scores, primary_ticker = cached_scores
+        else:
+            title_text = article.title.lower() if article.title else ""
+            summary_text = article.summary.lower() if article.summary else ""
         
-        # Use precompiled regex to find ticker symbols in $ format and parentheses
-        dollar_tickers = TICKER_PATTERN.findall(full_text.upper())
-        parens_tickers = PARENS_TICKER_PATTERN.findall(full_text.upper())
+            # Tickers whose company name may appear somewhere in the article
+            company_candidates = set()
+            if company_scan_regex is not None:
+                for alias in set(company_scan_regex.findall(full_text)):
+                    company_candidates.update(alias_candidates.get(alias, ()))
         
-        # Add initial scores for explicitly marked tickers
-        for ticker in dollar_tickers + parens_tickers:
-            if ticker in symbols_to_scan:
-                ticker_scores[ticker] = ticker_scores.get(ticker, 0) + 8
+            # Track ticker occurrences with a score to prioritize those most likely to be the main subject
+            ticker_scores = {}
+            primary_ticker = None
+            highest_score = 0
+            has_financial_context = None
         
-        # Now check for the actual ticker matches and company names
-        for ticker in symbols_to_scan:
-            # Skip very short tickers that are likely to cause false positives
-            if len(ticker) == 1:
-                continue
-                
-            # Skip if we already found it via regex
-            if ticker in ticker_scores:
-                continue
+            # Use precompiled regex to find ticker symbols in $ format and parentheses
+            # Add initial scores for explicitly marked tickers
+            for dollar_ticker, parens_ticker in MARKED_TICKER_PATTERN.findall(full_text.upper()):
+                ticker = dollar_ticker or parens_ticker
+                if ticker in symbols_to_scan_set:
+                    # findall returns new strings; intern them so articles share one object per ticker
+                    ticker = sys.intern(ticker)
+                    ticker_scores[ticker] = ticker_scores.get(ticker, 0) + 8
+        
+            # Tickers whose symbol appears somewhere in the article
+            ticker_candidates = set()
+            if ticker_scan_regex is not None:
+                for literal in set(ticker_scan_regex.findall(full_text)):
+                    ticker_candidates.update(literal_candidates.get(literal, ()))
             
-            # Initialize score for this ticker if not set
-            if ticker not in ticker_scores:
-                ticker_scores[ticker] = 0
-                
-            ticker_found = False
+            # Now check for the actual ticker matches and company names.
+            # Only tickers whose symbol or company name appears can score; keep the configured order
+            # since it decides ties for the primary ticker.
+            candidates = (ticker_candidates | company_candidates) & scannable_tickers
+            for ticker in sorted(candidates, key=ticker_order.__getitem__):
+                # Skip if we already found it via regex
+                if ticker in ticker_scores:
+                    continue
             
-            # Check for ticker in title (high importance)
-            if ticker in COMMON_WORD_TICKERS:
-                # For common words, use stricter patterns
-                title_patterns = [
-                    r'\$' + re.escape(ticker) + r'\b',
-                    r'\(' + re.escape(ticker) + r'\)',
-                    # Exact match case-sensitive for ticker
-                    re.escape(ticker)
-                ]
-                
-                # Check title for exact ticker match first (case sensitive)
-                if re.search(re.escape(ticker) + r'(?=[^a-zA-Z0-9]|$)', article.title or "", re.DOTALL):
-                    ticker_scores[ticker] += 10  # High score for exact ticker match in title
-                    ticker_found = True
-            else:
-                # Standard ticker patterns
-                title_presence = ticker.lower() in title_text or \
-                                f"${ticker.lower()}" in title_text or \
-                                f"({ticker.lower()})" in title_text
+                # Initialize score for this ticker if not set
+                if ticker not in ticker_scores:
+                    ticker_scores[ticker] = 0
                 
-                if title_presence:
-                    ticker_scores[ticker] += 8  # High score for ticker in title
-                    ticker_found = True
+                ticker_found = False
             
-            # Check for company name in title (very high importance)
-            if ticker in company_patterns:
-                for pattern in company_patterns[ticker]:
-                    if re.search(pattern, title_text, re.IGNORECASE):
-                        ticker_scores[ticker] += 12  # Very high score for company name in title
+                # Check for ticker in title (high importance)
+                if ticker in COMMON_WORD_TICKERS:
+                    # For common words, check title for exact ticker match (case sensitive)
+                    if exact_ticker_regexes[ticker].search(article.title or ""):
+                        ticker_scores[ticker] += 10  # High score for exact ticker match in title
+                        ticker_found = True
+                else:
+                    # Standard ticker patterns
+                    # (the $TICKER and (TICKER) forms contain the bare ticker, so one substring test covers all three)
+                    title_presence = ticker_lowers[ticker] in title_text
+                
+                    if title_presence:
+                        ticker_scores[ticker] += 8  # High score for ticker in title
                         ticker_found = True
-                        break
             
-            # For common word tickers, verify financial context
-            if ticker in COMMON_WORD_TICKERS and ticker_found:
-                financial_context_words = ["stock", "share", "price", "market", "investor", "trading", 
-                                          "nasdaq", "nyse", "exchange", "financ", "earn", "revenue"]
+                # Check for company name in title (very high importance)
+                if ticker in company_candidates and company_regexes[ticker].search(title_text):
+                    ticker_scores[ticker] += 12  # Very high score for company name in title
+                    ticker_found = True
+            
+                # For common word tickers, verify financial context
+                if ticker in COMMON_WORD_TICKERS and ticker_found:
+                    # The answer depends only on the article text, so check it at most once per article
+                    if has_financial_context is None:
+                        has_financial_context = any(word in full_text for word in FINANCIAL_CONTEXT_WORDS)
                 
-                # Check if financial context exists
-                if not any(word in full_text for word in financial_context_words):
-                    # Likely not actually about the stock, reset score
-                    ticker_scores[ticker] = 0
-                    ticker_found = False
+                    # Check if financial context exists
+                    if not has_financial_context:
+                        # Likely not actually about the stock, reset score
+                        ticker_scores[ticker] = 0
+                        ticker_found = False
             
-            # Only check summary if not already found in title or for additional scoring
-            if not ticker_found or ticker_scores[ticker] < 8:
-                # For common word tickers, use more restrictive patterns for summary
-                if ticker in COMMON_WORD_TICKERS:
-                    # Only match exact ticker references with $ prefix or in specific financial contexts
-                    summary_patterns = [
-                        r'\$' + re.escape(ticker) + r'\b',
-                        r'\(' + re.escape(ticker) + r'\)',
-                        r'ticker[s]?[\s:]+' + re.escape(ticker) + r'\b',
-                        r'stock[s]?[\s:]+' + re.escape(ticker) + r'\b',
-                        r'symbol[\s:]+' + re.escape(ticker) + r'\b',
-                        r'shares? of ' + re.escape(ticker) + r'\b',
-                    ]
-                    
-                    for pattern in summary_patterns:
-                        if re.search(pattern, summary_text, re.IGNORECASE):
+                # Only check summary if not already found in title or for additional scoring
+                if not ticker_found or ticker_scores[ticker] < 8:
+                    # For common word tickers, use more restrictive patterns for summary
+                    if ticker in COMMON_WORD_TICKERS:
+                        # Only match exact ticker references with $ prefix or in specific financial contexts
+                        if summary_ticker_regexes[ticker].search(summary_text):
                             ticker_scores[ticker] += 5  # Medium score for ticker in summary
                             ticker_found = True
-                            break
                             
-                    # Case sensitive check for exact ticker match in summary
-                    if not ticker_found and re.search(re.escape(ticker) + r'(?=[^a-zA-Z0-9]|$)', article.summary or "", re.DOTALL):
-                        ticker_scores[ticker] += 3  # Lower score for exact ticker match in summary
-                        ticker_found = True
-                else:
-                    # Standard ticker check in summary
-                    summary_presence = ticker.lower() in summary_text or \
-                                      f"${ticker.lower()}" in summary_text or \
-                                      f"({ticker.lower()})" in summary_text
+                        # Case sensitive check for exact ticker match in summary
+                        if not ticker_found and exact_ticker_regexes[ticker].search(article.summary or ""):
+                            ticker_scores[ticker] += 3  # Lower score for exact ticker match in summary
+                            ticker_found = True
+                    else:
+                        # Standard ticker check in summary
+                        summary_presence = ticker_lowers[ticker] in summary_text
                     
-                    if summary_presence:
-                        ticker_scores[ticker] += 4  # Medium score for ticker in summary
-                        ticker_found = True
-                
-                # Check for company name in summary if ticker not found yet
-                if not ticker_found and ticker in company_patterns:
-                    for pattern in company_patterns[ticker]:
-                        if re.search(pattern, summary_text, re.IGNORECASE):
-                            # Check frequency of mentions
-                            matches = re.findall(pattern, summary_text, re.IGNORECASE)
-                            ticker_scores[ticker] += 2 + min(len(matches), 3)  # Base score + bonus for frequency
+                        if summary_presence:
+                            ticker_scores[ticker] += 4  # Medium score for ticker in summary
                             ticker_found = True
-                            break
+                
+                    # Check for company name in summary if ticker not found yet
+                    if not ticker_found and ticker in company_candidates:
+                        # Check frequency of mentions of the first alias that appears
+                        for alias_regex in company_alias_regexes[ticker]:
+                            matches = alias_regex.findall(summary_text)
+                            if matches:
+                                ticker_scores[ticker] += 2 + min(len(matches), 3)  # Base score + bonus for frequency
+                                ticker_found = True
+                                break
+            
+                # Update primary ticker if this has the highest score
+                if ticker_scores[ticker] > highest_score:
+                    highest_score = ticker_scores[ticker]
+                    primary_ticker = ticker
             
-            # Update primary ticker if this has the highest score
-            if ticker_scores[ticker] > highest_score:
-                highest_score = ticker_scores[ticker]
-                primary_ticker = ticker
+            score_cache[score_key] = (ticker_scores, primary_ticker)
         
         # Second pass: determine which tickers to include in the article
         current_article_found_tickers = set()
@@ -643,37 +1219,27 @@ def fetch_all_news(stock_symbols: Optional[List[str]] = None, source_limit: Opti
             if score >= 3:  # Minimum threshold for inclusion
                 current_article_found_tickers.add(ticker)
                 # Log the score for debugging
-                logger.debug(f"Ticker {ticker} for article '{article.title[:40]}...' has score {score}")
+                logger.debug("Ticker %s for article '%.40s...' has score %s", ticker, article.title, score)
         
         # Always include primary ticker if it exists and has a non-zero score
         if primary_ticker and ticker_scores[primary_ticker] > 0:
             current_article_found_tickers.add(primary_ticker)
             # Mark the primary ticker in the article for future reference
             article.primary_ticker = primary_ticker
-            logger.debug(f"Primary ticker for article '{article.title[:40]}...' is {primary_ticker} with score {ticker_scores[primary_ticker]}")
+            logger.debug("Primary ticker for article '%.40s...' is %s with score %s", article.title, primary_ticker, ticker_scores[primary_ticker])
         
-        # Set the tickers for this article
+        # Set the tickers for this article (prices are fetched in one batch after filtering)
         if current_article_found_tickers:
-            article.tickers = sorted(list(current_article_found_tickers))
-            if article.tickers:  # Ensure tickers are present before fetching prices
-                article.ticker_prices = fetch_current_prices(article.tickers)
+            article.tickers = sorted(current_article_found_tickers)
+            article.ticker_set = frozenset(current_article_found_tickers)
         
         # Only filter out articles if specific stock symbols were requested
         if stock_symbols:
-            if current_article_found_tickers and any(s in current_article_found_tickers for s in symbols_to_scan):
-                # For stricter filtering, only include if one of the requested symbols is the primary ticker
-                # or has a high enough score
-                should_include = False
-                
-                for s in symbols_to_scan:
-                    if s in current_article_found_tickers:
-                        # Include if it's the primary ticker or has a high score
-                        if s == primary_ticker or ticker_scores.get(s, 0) >= 8:
-                            should_include = True
-                            break
-                
-                if should_include:
-                    processed_articles.append(article)
+            # For stricter filtering, only include if one of the requested symbols found in the article
+            # is the primary ticker or has a high enough score
+            if any(ticker == primary_ticker or ticker_scores[ticker] >= 8
+                   for ticker in current_article_found_tickers if ticker in symbols_to_scan_set):
+                processed_articles.append(article)
             
         else:
             # If no specific symbols requested, keep all articles with identified tickers
@@ -684,4 +1250,31 @@ def fetch_all_news(stock_symbols: Optional[List[str]] = None, source_limit: Opti
     else:
         logger.info(f"Returning {len(processed_articles)} articles with analyzed tickers.")
     
+    if fetch_prices:
+        attach_current_prices(processed_articles)
+    
     return processed_articles
+
+
+def attach_current_prices(articles: List[Article]) -> None:
+    """Set ticker_prices on each article, fetching prices once for the unique tickers of all of them
+    instead of once per article."""
+    set_article_prices(articles, fetch_article_prices(articles))
+
+
+def fetch_article_prices(articles: List[Article]) -> Dict[str, float]:
+    """Fetch current prices for the unique tickers of all the articles, without changing the articles."""
+    unique_tickers = set()
+    for article in articles:
+        unique_tickers.update(article.ticker_set)
+    if not unique_tickers:
+        return {}
+    logger.info(f"Fetching prices for {len(unique_tickers)} unique tickers across {len(articles)} articles")
+    return fetch_current_prices(sorted(unique_tickers))
+
+
+def set_article_prices(articles: List[Article], prices: Dict[str, float]) -> None:
+    """Set ticker_prices on each article from a ticker -> price mapping."""
+    for article in articles:
+        if article.tickers:
+            article.ticker_prices = {t: prices[t] for t in article.tickers if t in prices}
@@ -0,0 +1,297 @@
+import unittest
+from unittest import mock
+import random
+import re
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import news_fetcher
+from article import Article
+
+# Small stock map covering the special-cased aliases, multi-word names, common-word tickers and prefix tickers
+TEST_STOCK_MAP = {
+    'AAPL': 'Apple Inc.', 'MSFT': 'Microsoft Corporation', 'GOOGL': 'Alphabet Inc.', 'GOOG': 'Alphabet Class C',
+    'TSLA': 'Tesla, Inc.', 'META': 'Meta Platforms', 'BAC': 'Bank of America', 'BK': 'Bank New York',
+    'ON': 'ON Semiconductor', 'ALL': 'Allstate Corp', 'IT': 'Gartner IT', 'CAT': 'Caterpillar Inc.',
+    'F': 'Ford Motor', 'GE': 'General Electric', 'GM': 'General Motors', 'KO': 'Coca-Cola Company',
+    'A': 'Agilent', 'GO': 'Grocery Outlet', 'GOOD': 'Gladstone Commercial', 'BA': 'Boeing',
+}
+TEST_WORDS = (
+    'apple microsoft google alphabet tesla musk bank of america new york on all it cat ford general electric '
+    'motors meta facebook coca-cola company stock shares price market the a $AAPL (TSLA) $ON (IT) ALL ON IT '
+    'CAT GE GM ticker: symbol shares of earnings revenue Apple Bank GENERAL KO BAC go goog good GOOD GO $GOOG '
+    'boeing BA ba grocery outlet gladstone'
+).split() + ['lorem', 'ipsum', 'dolor', 'news'] * 10
+
+
+def _reference_scores(article, symbols_to_scan, stock_map):
+    """Ticker scoring as originally written (one regex per alias and ticker, no prefilter or caches).
+    Returns the found tickers, the primary ticker and whether a symbol-filtered fetch keeps the article."""
+    company_patterns = {}
+    for ticker, company in stock_map.items():
+        if ticker in symbols_to_scan:
+            name_parts = company.split()
+            if ticker == 'AAPL' or 'Apple' in company:
+                patterns = [r'\bapple\b']
+            elif ticker == 'MSFT' or 'Microsoft' in company:
+                patterns = [r'\bmicrosoft\b']
+            elif ticker == 'GOOG' or ticker == 'GOOGL' or 'Google' in company or 'Alphabet' in company:
+                patterns = [r'\bgoogle\b', r'\balphabet\b']
+            elif ticker == 'AMZN' or 'Amazon' in company:
+                patterns = [r'\bamazon\b']
+            elif ticker == 'META' or 'Meta' in company or 'Facebook' in company:
+                patterns = [r'\bmeta\b', r'\bfacebook\b']
+            elif ticker == 'TSLA' or 'Tesla' in company:
+                patterns = [r'\btesla\b', r'\bmusk\b']
+            elif ticker == 'NVDA' or 'NVIDIA' in company:
+                patterns = [r'\bnvidia\b']
+            else:
+                patterns = [r'\b' + re.escape(name_parts[0].lower()) + r'\b']
+                if len(name_parts) > 1:
+                    patterns.append(r'\b' + re.escape(company.lower()) + r'\b')
+            company_patterns[ticker] = patterns
+
+    title_text = article.title.lower() if article.title else ""
+    summary_text = article.summary.lower() if article.summary else ""
+    full_text = title_text + " " + summary_text
+    ticker_scores = {}
+    primary_ticker = None
+    highest_score = 0
+    for ticker in re.findall(r'\$([A-Z]{1,5})\b', full_text.upper()) + re.findall(r'\(([A-Z]{1,5})\)', full_text.upper()):
+        if ticker in symbols_to_scan:
+            ticker_scores[ticker] = ticker_scores.get(ticker, 0) + 8
+    for ticker in symbols_to_scan:
+        if len(ticker) == 1 or ticker in ticker_scores:
+            continue
+        ticker_scores[ticker] = 0
+        ticker_found = False
+        if ticker in news_fetcher.COMMON_WORD_TICKERS:
+            if re.search(re.escape(ticker) + r'(?=[^a-zA-Z0-9]|$)', article.title or ""):
+                ticker_scores[ticker] += 10
+                ticker_found = True
+        elif ticker.lower() in title_text:
+            ticker_scores[ticker] += 8
+            ticker_found = True
+        for pattern in company_patterns.get(ticker, ()):
+            if re.search(pattern, title_text, re.IGNORECASE):
+                ticker_scores[ticker] += 12
+                ticker_found = True
+                break
+        if ticker in news_fetcher.COMMON_WORD_TICKERS and ticker_found:
+            if not any(word in full_text for word in news_fetcher.FINANCIAL_CONTEXT_WORDS):
+                ticker_scores[ticker] = 0
+                ticker_found = False
+        if not ticker_found or ticker_scores[ticker] < 8:
+            if ticker in news_fetcher.COMMON_WORD_TICKERS:
+                escaped = re.escape(ticker)
+                for pattern in (r'\$' + escaped + r'\b', r'\(' + escaped + r'\)', r'ticker[s]?[\s:]+' + escaped + r'\b',
+                                r'stock[s]?[\s:]+' + escaped + r'\b', r'symbol[\s:]+' + escaped + r'\b',
+                                r'shares? of ' + escaped + r'\b'):
+                    if re.search(pattern, summary_text, re.IGNORECASE):
+                        ticker_scores[ticker] += 5
+                        ticker_found = True
+                        break
+                if not ticker_found and re.search(escaped + r'(?=[^a-zA-Z0-9]|$)', article.summary or ""):
+                    ticker_scores[ticker] += 3
+                    ticker_found = True
+            elif ticker.lower() in summary_text:
+                ticker_scores[ticker] += 4
+                ticker_found = True
+            if not ticker_found:
+                for pattern in company_patterns.get(ticker, ()):
+                    if re.search(pattern, summary_text, re.IGNORECASE):
+                        matches = re.findall(pattern, summary_text, re.IGNORECASE)
+                        ticker_scores[ticker] += 2 + min(len(matches), 3)
+                        ticker_found = True
+                        break
+        if ticker_scores[ticker] > highest_score:
+            highest_score = ticker_scores[ticker]
+            primary_ticker = ticker
+
+    found = {ticker for ticker, score in ticker_scores.items() if score >= 3}
+    if primary_ticker and ticker_scores[primary_ticker] > 0:
+        found.add(primary_ticker)
+    else:
+        primary_ticker = None
+    included = any(s in found and (s == primary_ticker or ticker_scores.get(s, 0) >= 8) for s in symbols_to_scan)
+    return sorted(found) or None, primary_ticker, included
+
+
+class TickerScoringTest(unittest.TestCase):
+    """Check the optimized ticker scoring against the original per-pattern implementation"""
+
+    def _random_articles(self, seed, count=200):
+        rng = random.Random(seed)
+        articles = []
+        for i in range(count):
+            title = ' '.join(rng.choice(TEST_WORDS) for _ in range(rng.randint(0, 12)))
+            summary = ' '.join(rng.choice(TEST_WORDS) for _ in range(rng.randint(0, 30))) if rng.random() < 0.9 else None
+            articles.append(Article(title=title, link=str(i), published_date=datetime(2024, 1, 1), summary=summary, source='test'))
+        # Repeated texts exercise the score cache
+        articles.append(Article(title="Tesla and Musk: Musk says", link="tsla", published_date=datetime(2024, 1, 1),
+                                summary="musk tesla musk musk news", source='test'))
+        articles.append(Article(title="Tesla and Musk: Musk says", link="tsla-copy", published_date=datetime(2024, 1, 1),
+                                summary="musk tesla musk musk news", source='test'))
+        return articles
+
+    def _fetch(self, articles, stock_symbols):
+        with mock.patch.object(news_fetcher, 'load_sources', return_value=[]), \
+             mock.patch.object(news_fetcher, 'fetch_articles_in_parallel', return_value=articles), \
+             mock.patch.object(news_fetcher, 'fetch_major_stocks', return_value=dict(TEST_STOCK_MAP)):
+            return news_fetcher.fetch_all_news(stock_symbols=stock_symbols, fetch_prices=False)
+
+    def test_scores_match_reference(self):
+        """Found tickers, primary ticker and symbol filtering match the original implementation"""
+        for stock_symbols in (None, ['AAPL'], ['TSLA', 'META'], ['ON', 'IT', 'BAC'], ['GO', 'GOOG', 'GOOD', 'BA']):
+            symbols_to_scan = stock_symbols or list(TEST_STOCK_MAP)
+            for seed in range(5):
+                articles = self._random_articles(seed)
+                kept = {article.link for article in self._fetch(articles, stock_symbols)}
+                for article in articles:
+                    tickers, primary_ticker, included = _reference_scores(article, symbols_to_scan, TEST_STOCK_MAP)
+                    with self.subTest(symbols=stock_symbols, seed=seed, title=article.title, summary=article.summary):
+                        self.assertEqual(article.tickers, tickers)
+                        self.assertEqual(article.primary_ticker, primary_ticker)
+                        if stock_symbols:
+                            self.assertEqual(article.link in kept, included)
+
+
+class FeedParsingTest(unittest.TestCase):
+    """Check the lxml feed parser"""
+
+    RSS_FEED = (b'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>'
+                b'<item><title>Apple (AAPL) rises</title><link>http://x/1</link>'
+                b'<pubDate>Mon, 14 Oct 2024 10:00:00 GMT</pubDate></item>'
+                b'<item><title>Other</title><link>http://x/2</link></item>'
+                b'</channel></rss>')
+
+    def test_bad_item_is_skipped(self):
+        """An item that fails to convert is dropped without losing the rest of the feed"""
+        parse_feed_date = news_fetcher._parse_feed_date
+
+        def failing_first_date(value):
+            if value is not None:
+                raise ValueError("bad date")
+            return parse_feed_date(value)
+
+        with mock.patch.object(news_fetcher, '_parse_feed_date', side_effect=failing_first_date), \
+             self.assertLogs(news_fetcher.logger, level='ERROR'):
+            articles = news_fetcher._parse_feed_xml(self.RSS_FEED, 'test')
+        self.assertEqual([article.link for article in articles], ['http://x/2'])
+
+    def test_unknown_document_falls_back(self):
+        """Documents that are neither RSS nor Atom return None so feedparser is used"""
+        self.assertIsNone(news_fetcher._parse_feed_xml(b'<html/>', 'test'))
+
+
+class TriePatternTest(unittest.TestCase):
+    """Check the trie-factored alternation against a plain longest-first alternation"""
+
+    WORDS = ('go', 'goog', 'googl', 'good', 'ba', 'bac', 'bac.b', 'bk', 'a', 'all', 'apple', 'on', 'one')
+
+    def test_matches_plain_alternation(self):
+        """Every position reports the same (longest) word as the plain alternation"""
+        trie_regex = re.compile('(?=(' + news_fetcher._trie_pattern(self.WORDS) + '))')
+        plain_regex = re.compile('(?=(' + '|'.join(re.escape(word) for word in sorted(self.WORDS, key=len, reverse=True)) + '))')
+        rng = random.Random(0)
+        alphabet = 'abcdeglopnk. '
+        texts = ['goog googl good go bac.b bacb ba.b all apple one on'] + [
+            ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 40))) for _ in range(500)
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                self.assertEqual(trie_regex.findall(text), plain_regex.findall(text))
+
+    def test_prefix_closure(self):
+        """Each word collects the values of the words that are its prefixes"""
+        closure = news_fetcher._prefix_closure({'go': {'GO'}, 'goog': {'GOOG'}, 'googl': {'GOOGL'}, 'good': {'GOOD'}})
+        self.assertEqual(closure['go'], frozenset({'GO'}))
+        self.assertEqual(closure['goog'], frozenset({'GO', 'GOOG'}))
+        self.assertEqual(closure['googl'], frozenset({'GO', 'GOOG', 'GOOGL'}))
+        self.assertEqual(closure['good'], frozenset({'GO', 'GOOD'}))
+
+
+class PriceCacheTest(unittest.TestCase):
+    """Check the SQLite price cache, using a fresh database file per test"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        patcher = mock.patch.multiple(news_fetcher, PRICE_CACHE_FILE=Path(temp_dir.name) / "price_cache.db", _price_db=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._close_db)
+
+    def _close_db(self):
+        if news_fetcher._price_db is not None:
+            news_fetcher._price_db.close()
+
+    def _age_price(self, ticker, minutes):
+        """Move a cached price's timestamp back by the given number of minutes"""
+        with news_fetcher._price_db_lock:
+            connection = news_fetcher._price_db_connection()
+            connection.execute("UPDATE prices SET timestamp = ? WHERE ticker = ?",
+                               ((datetime.now() - timedelta(minutes=minutes)).timestamp(), ticker))
+            connection.commit()
+
+    def test_round_trip(self):
+        """Saved prices are read back until they expire, and stay available as stale prices"""
+        news_fetcher.save_prices({'AAPL': 101.5, 'MSFT': 402.25})
+        self.assertEqual(news_fetcher.get_cached_prices(['AAPL', 'MSFT', 'TSLA']), {'AAPL': 101.5, 'MSFT': 402.25})
+        self.assertEqual(news_fetcher.get_cached_price('AAPL'), 101.5)
+
+        news_fetcher.save_prices({'AAPL': 103.0})
+        self.assertEqual(news_fetcher.get_cached_price('AAPL'), 103.0)
+
+        self._age_price('MSFT', news_fetcher.PRICE_CACHE_EXPIRATION_MINUTES + 1)
+        self.assertEqual(news_fetcher.get_cached_prices(['AAPL', 'MSFT']), {'AAPL': 103.0})
+        self.assertEqual(news_fetcher.get_cached_prices(['MSFT'], news_fetcher.PRICE_STALE_MAX_MINUTES), {'MSFT': 402.25})
+        self.assertEqual(news_fetcher.get_cached_prices([]), {})
+
+    def _set_failures(self, ticker, failures, minutes_ago):
+        """Record a failure streak for the ticker whose last failure was the given number of minutes ago"""
+        with news_fetcher._price_db_lock:
+            connection = news_fetcher._price_db_connection()
+            connection.execute("INSERT OR REPLACE INTO price_failures (ticker, failures, timestamp) VALUES (?, ?, ?)",
+                               (ticker, failures, (datetime.now() - timedelta(minutes=minutes_ago)).timestamp()))
+            connection.commit()
+
+    def test_backoff_window_grows(self):
+        """The backoff doubles per consecutive failure up to the maximum, and a saved price clears it"""
+        for _ in range(3):
+            news_fetcher.record_price_failure('XYZ')
+        self.assertEqual(news_fetcher.get_backed_off_tickers(['XYZ', 'AAPL']), frozenset({'XYZ'}))
+
+        base = news_fetcher.PRICE_FAILURE_BACKOFF_MINUTES
+        maximum = news_fetcher.PRICE_FAILURE_BACKOFF_MAX_MINUTES
+        for failures, window in ((1, base), (2, base * 2), (3, base * 4), (20, maximum)):
+            with self.subTest(failures=failures):
+                self._set_failures('XYZ', failures, window - 1)
+                self.assertIn('XYZ', news_fetcher.get_backed_off_tickers(['XYZ']))
+                self._set_failures('XYZ', failures, window + 1)
+                self.assertNotIn('XYZ', news_fetcher.get_backed_off_tickers(['XYZ']))
+
+        self._set_failures('XYZ', 1, 0)
+        news_fetcher.save_prices({'XYZ': 1.0})
+        self.assertEqual(news_fetcher.get_backed_off_tickers(['XYZ']), frozenset())
+
+    def test_failed_lookup_falls_back_to_stale_price(self):
+        """A failing lookup returns the stale cached price, and is skipped while backed off"""
+        news_fetcher.save_prices({'AAPL': 101.5})
+        self._age_price('AAPL', news_fetcher.PRICE_CACHE_EXPIRATION_MINUTES + 60)
+
+        with mock.patch.object(news_fetcher.yf, 'Ticker', side_effect=RuntimeError("rate limited")) as ticker_mock, \
+             self.assertLogs(news_fetcher.logger, level='ERROR'):
+            self.assertEqual(news_fetcher.fetch_single_ticker_price('AAPL'), 101.5)
+            self.assertEqual(ticker_mock.call_count, 1)
+            self.assertIn('AAPL', news_fetcher.get_backed_off_tickers(['AAPL']))
+
+            self.assertEqual(news_fetcher.fetch_single_ticker_price('AAPL'), 101.5)
+            self.assertEqual(ticker_mock.call_count, 1)
+
+            self.assertIsNone(news_fetcher.fetch_single_ticker_price('NOPE'))
+
+
+if __name__ == "__main__":
+    unittest.main()
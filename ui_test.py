@@ -1,11 +1,25 @@
 import unittest
-import subprocess
+import functools
 import time
-import signal
 import os
 import sys
 import logging
 import re
+from datetime import datetime, timedelta
+
+from main import NewsTUI, build_arg_parser, collect_articles, resolve_stock_symbols
+from news_fetcher import generate_mock_articles
+
+# (key, action) pairs the main screen must bind
+EXPECTED_BINDINGS = {
+    ("q", "quit"),  # Quit command
+    ("up", "cursor_up"),  # Up arrow
+    ("down", "cursor_down"),  # Down arrow
+    ("f", "show_filter_menu"),  # Filter
+    ("r", "reset_filter"),  # Reset filter
+}
+# A Binding(...) of one of the expected keys, capturing its key and action
+BINDING_PATTERN = re.compile(r'Binding\("(q|up|down|f|r)"\s*,\s*"(\w+)"')
 
 class UICommandTest(unittest.TestCase):
     """Test the UI commands in the stock news app"""
@@ -22,143 +36,129 @@ class UICommandTest(unittest.TestCase):
         if not os.path.exists("main.py"):
             cls.logger.error("main.py not found. Tests cannot run.")
             sys.exit(1)
-    
-    def test_mock_data_loads(self):
-        """Test if the app loads with mock data"""
-        self.logger.info("Testing mock data loading")
-        try:
-            # Run with a timeout to ensure it doesn't hang
-            output = subprocess.check_output(
-                ["python3", "main.py", "--mock"], 
-                stderr=subprocess.STDOUT,
-                timeout=1  # Only wait a second, we'll kill it immediately
-            )
-            self.fail("App didn't start or exited too quickly")
-        except subprocess.TimeoutExpired:
-            # This is expected - app is running
-            self.logger.info("App started successfully")
-            
-            # Kill the process
-            subprocess.run(["pkill", "-f", "python3 main.py"])
+        
+        # Read the app source once for all source checks
+        with open("main.py", "r") as f:
+            cls.main_content = f.read()
     
     def test_ui_commands_registered(self):
         """Test that UI commands are correctly registered in the app"""
         self.logger.info("Testing UI commands registration")
         
-        # We need to check the app code for command bindings
-        with open("main.py", "r") as f:
-            main_content = f.read()
-            
-        # Check for key bindings
-        self.assertIn("q", "quit", main_content)  # Quit command
-        self.assertIn("up", "cursor_up", main_content)  # Up arrow
-        self.assertIn("down", "cursor_down", main_content)  # Down arrow
-        self.assertIn("f", "show_filter_menu", main_content)  # Filter
-        self.assertIn("r", "reset_filter", main_content)  # Reset filter
+        # Check for key bindings, each key bound to its action
+        found = {(match[1], match[2]) for match in BINDING_PATTERN.finditer(self.main_content)}
+        self.assertEqual(found, EXPECTED_BINDINGS)
         
         self.logger.info("UI commands are correctly registered")
+
+
+class NewsTUIPilotTest(unittest.IsolatedAsyncioTestCase):
+    """Drive the TUI in-process with Textual's pilot and check the app state"""
+    
+    # Seconds to wait for the background article loader
+    LOAD_TIMEOUT = 5.0
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.logger = logging.getLogger("UITest")
+    
+    def _make_app(self, *argv):
+        """Build the app the way main() does for the given command line"""
+        args = build_arg_parser().parse_args(["--mock", *argv])
+        stock_symbols_list = resolve_stock_symbols(args)
+        article_loader = functools.partial(collect_articles, args, stock_symbols_list, args.debug, args.mock)
+        return NewsTUI(articles=[], cli_args=args, article_loader=article_loader)
     
-    def test_article_selection(self):
+    async def _wait_for_articles(self, pilot):
+        """Let the app run until the background loader has filled the list"""
+        deadline = time.monotonic() + self.LOAD_TIMEOUT
+        delay = 0.01
+        while not pilot.app.loaded_successfully:
+            if time.monotonic() > deadline:
+                self.fail("Articles were not loaded in time")
+            await pilot.pause(delay)
+            delay = min(delay * 2, 0.2)
+    
+    async def test_mock_data_loads(self):
+        """Test if the app loads with mock data"""
+        self.logger.info("Testing mock data loading")
+        app = self._make_app()
+        async with app.run_test() as pilot:
+            await self._wait_for_articles(pilot)
+            self.assertEqual(len(app.all_articles), len(generate_mock_articles()))
+            self.assertEqual(len(app.article_list_pane.children), len(app.articles))
+    
+    async def test_article_selection(self):
         """Test the article selection functionality"""
         self.logger.info("Testing article selection")
-        
-        # Clear the log file first
-        with open("app.log", "w") as f:
-            f.truncate(0)
+        app = self._make_app()
+        async with app.run_test() as pilot:
+            await self._wait_for_articles(pilot)
+            # The first article is selected and shown in the detail pane
+            self.assertEqual(app.article_list_pane.index, 0)
+            self.assertIs(app.article_detail_pane.selected_article, app.articles[0])
             
-        # Start app with mock data and debug flag
-        proc = subprocess.Popen(
-            ["python3", "main.py", "--mock", "--debug"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-        try:
-            # Give it time to start up
-            time.sleep(2)
-            
-            # Check if log shows it started and loaded articles
-            with open("app.log", "r") as f:
-                log_content = f.read()
-                self.assertIn("Starting TUI with", log_content)
-                self.assertIn("Added", log_content)
-                self.assertIn("Setting selection to first article", log_content)
-                self.assertIn("First article has article_data", log_content)
-            
-            self.logger.info("Article selection functionality works")
-            
-        finally:
-            # Cleanup
-            proc.terminate()
-            time.sleep(1)
-            proc.kill()  # Make sure it's really gone
-            self.logger.info("App terminated")
+            await pilot.press("down")
+            self.assertEqual(app.article_list_pane.index, 1)
     
-    def test_stock_filtering(self):
+    async def test_stock_filtering(self):
         """Test filtering by stock ticker"""
         self.logger.info("Testing stock filtering")
-        
-        # Clear the log file first
-        with open("app.log", "w") as f:
-            f.truncate(0)
-        
-        # Run with AAPL stock filter and mock data
-        proc = subprocess.Popen(
-            ["python3", "main.py", "--mock", "--stocks", "AAPL", "--debug"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-        try:
-            # Give it time to start up
-            time.sleep(2)
-            
-            # Check log for successful filtering
-            with open("app.log", "r") as f:
-                log_content = f.read()
-                self.assertIn("Fetching news for stocks: AAPL", log_content)
-                self.assertIn("Filtering", log_content)
-                self.assertIn("ticker AAPL", log_content)
+        app = self._make_app("--stocks", "aapl")
+        self.assertEqual(resolve_stock_symbols(app.cli_args), ["AAPL"])
+        async with app.run_test() as pilot:
+            await self._wait_for_articles(pilot)
+            self.assertTrue(all("AAPL" in article.ticker_set for article in app.all_articles))
             
-            self.logger.info("Stock filtering works")
-            
-        finally:
-            # Cleanup
-            proc.terminate()
-            time.sleep(1)
-            proc.kill()
-            self.logger.info("App terminated")
+            # Filtering from the TUI narrows the list, resetting restores it
+            app.filter_by_ticker("TSLA")
+            self.assertEqual(app.current_filter, "TSLA")
+            self.assertTrue(app.articles)
+            self.assertTrue(all("TSLA" in article.ticker_set for article in app.articles))
+            await pilot.press("r")
+            self.assertIsNone(app.current_filter)
+            self.assertEqual(len(app.articles), len(app.all_articles))
     
-    def test_time_interval_filtering(self):
+    async def test_time_interval_filtering(self):
         """Test filtering by time interval"""
         self.logger.info("Testing time interval filtering")
+        started = datetime.now()
+        app = self._make_app("--time-interval", "last-4-hours")
+        async with app.run_test() as pilot:
+            await self._wait_for_articles(pilot)
+            self.assertLess(len(app.all_articles), len(generate_mock_articles()))
+            for article in app.all_articles:
+                self.assertGreaterEqual(article.published_date, started - timedelta(hours=4))
+
+    async def test_load_error_is_shown(self):
+        """A failing article loader replaces the loading notice with the error"""
+        self.logger.info("Testing background load failure")
         
-        # Clear the log file first
-        with open("app.log", "w") as f:
-            f.truncate(0)
+        def failing_loader():
+            raise RuntimeError("feeds unavailable")
         
-        # Run with time interval filter
-        proc = subprocess.Popen(
-            ["python3", "main.py", "--mock", "--time-interval", "last-4-hours", "--debug"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-        try:
-            # Give it time to start up
-            time.sleep(2)
-            
-            # Check log for successful filtering
-            with open("app.log", "r") as f:
-                log_content = f.read()
-                self.assertIn("Filtering articles published since", log_content)
-                self.assertIn("after time filter", log_content)
-            
-            self.logger.info("Time interval filtering works")
-            
-        finally:
-            # Cleanup
-            proc.terminate()
-            time.sleep(1)
-            proc.kill()
-            self.logger.info("App terminated")
+        app = NewsTUI(articles=[], cli_args=build_arg_parser().parse_args(["--mock"]), article_loader=failing_loader)
+        async with app.run_test() as pilot:
+            deadline = time.monotonic() + self.LOAD_TIMEOUT
+            while "feeds unavailable" not in str(app.article_detail_pane.content):
+                if time.monotonic() > deadline:
+                    self.fail("Load error was not shown")
+                await pilot.pause(0.01)
+            self.assertFalse(app.loaded_successfully)
+
+    async def test_prices_are_shown_after_loading(self):
+        """Prices from the price loader are set on the UI thread and shown in the selected article"""
+        self.logger.info("Testing background price loading")
+        app = self._make_app("--stocks", "aapl")
+        app.price_loader = lambda articles: {"AAPL": 123.45}
+        async with app.run_test() as pilot:
+            await self._wait_for_articles(pilot)
+            deadline = time.monotonic() + self.LOAD_TIMEOUT
+            while "$123.45" not in str(app.article_detail_pane.content):
+                if time.monotonic() > deadline:
+                    self.fail("Prices were not shown")
+                await pilot.pause(0.01)
+            self.assertEqual(app.articles[0].ticker_prices.get("AAPL"), 123.45)
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file